@@ -0,0 +1,199 @@
+"""
+Headless frame-time benchmark for Bakunawa.
+
+Runs the real Game (drawing included) on SDL's dummy video driver at fixed levels for each
+difficulty, types the answers of the falling words (only ones a sound wave can still reach, and only
+while the gong is free), and records p50/p95/p99 frame times plus a
+per-phase breakdown (events, word/projectile updates, draw_screen, drawing, flip).
+Results are written as JSON so runs can be compared over time.
+
+Example:
+    python bakunawa_benchmark.py --assets "/path/to/assets" --levels 1 10 50 200 --output bench.json
+"""
+import json
+import platform
+import sys
+import time
+
+import bakunawa_cli
+
+DIFFICULTIES = ['Madali', 'Katamtaman', 'Mahirap']
+
+
+def percentile(sorted_values, fraction):
+    """Returns the value at fraction (0..1) of an already sorted list, nearest-rank."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * (len(sorted_values) - 1)))))
+    return sorted_values[index]
+
+
+def summarize(values_ms):
+    """Returns mean/p50/p95/p99/max of a list of millisecond samples."""
+    ordered = sorted(values_ms)
+    return {
+        'mean': sum(ordered) / len(ordered) if ordered else 0.0,
+        'p50': percentile(ordered, 0.50),
+        'p95': percentile(ordered, 0.95),
+        'p99': percentile(ordered, 0.99),
+        'max': ordered[-1] if ordered else 0.0,
+    }
+
+
+def reachable(bakunawa, game, word):
+    """
+    True if a sound wave sent at word now still hits it. The wave leaves when the gong animation ends
+    (at once with launch_on_keypress) and flies to where the meteor was then, while the meteor keeps falling.
+    """
+    fall = word.speed * bakunawa.FPS # Pixels per second
+    wait = 0.0 if game.launch_on_keypress else game.actor_animation_duration_frames / game.actor_animation_speed
+    target_x, target_y = word.bulalakaw.rect.centerx, word.bulalakaw.rect.centery + fall * wait
+    start_x, start_y = game.projectile_origin()
+    flight = ((target_x - start_x) ** 2 + (target_y - start_y) ** 2) ** 0.5 / bakunawa.PROJECTILE_SPEED
+    return (word.get_bottom() + fall * wait < bakunawa.HEIGHT # Still on screen at the launch
+            and fall * flight < word.bulalakaw.rect.height / 2) # and not fallen past the wave by the time it arrives
+
+
+def typed_answer_events(bakunawa, game):
+    """Builds the events that type and submit the lowest untyped word on screen that a wave can still hit."""
+    pygame = bakunawa.pygame
+    if game.actor_is_animating and not game.launch_on_keypress:
+        return [] # Submitting now would replace the launch still waiting for the gong animation
+    candidates = [word for word in game.word_objects
+                  if not word.typed and word.get_bottom() > 0 and reachable(bakunawa, game, word)]
+    if not candidates:
+        return []
+    target = max(candidates, key=lambda word: word.get_bottom())
+    return [
+        pygame.event.Event(pygame.TEXTINPUT, text=target.text),
+        pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RETURN, mod=0, unicode='\r', scancode=0),
+    ]
+
+
+def run_case(bakunawa, game, difficulty, level, frames, warmup, type_every):
+    """Benchmarks one (difficulty, level) case and returns its result dict."""
+    game.reset_progress()
+    game.paused = False
+    game.game_over = False
+    game.select_difficulty(difficulty)
+    game.last_choices_before_pause = list(game.choices)
+    game.level = level
+    game.clear_projectiles()
+    game.renderer.invalidate()
+
+    frame_ms = []
+    frame_phases = [] # Per measured frame: phase name -> seconds
+    entity_counts = []
+    created_before = None
+    game.timer.enabled = True
+    for frame in range(warmup + frames):
+        # Keep the measured level: never run out of lives, and regenerate the same level when cleared
+        game.lives = bakunawa.LIVES_START
+        if game.level != level:
+            game.level = level
+        events = typed_answer_events(bakunawa, game) if frame % type_every == 0 else []
+
+        start = time.perf_counter()
+        game.run_frame(bakunawa.FIXED_DT, events, (0, 0))
+        elapsed_ms = (time.perf_counter() - start) * 1000.0
+
+        if frame < warmup:
+            continue
+        if created_before is None:
+            created_before = {name: pool['created'] for name, pool in bakunawa.pool_stats().items()}
+            game.latency = bakunawa.LatencyTracker() # Only the measured frames' answers
+        frame_ms.append(elapsed_ms)
+        frame_phases.append(game.timer.frames[-1]) # This frame, as end_frame() kept it in the profiler history
+        entity_counts.append(len(game.word_objects) + len(game.projectiles))
+    game.timer.enabled = False
+
+    pools = bakunawa.pool_stats()
+    created_before = created_before or {}
+
+    # A phase that did not run in a frame (e.g. generate_level) counts as 0 ms there
+    phase_names = sorted(set().union(*frame_phases))
+    phase_ms = {name: [phases.get(name, 0.0) * 1000.0 for phases in frame_phases] for name in phase_names}
+
+    return {
+        'difficulty': DIFFICULTIES[difficulty],
+        'level': level,
+        'frames': frames,
+        'frame_ms': summarize(frame_ms),
+        'phases_ms': {phase: summarize(samples) for phase, samples in phase_ms.items()},
+        'latency_ms': game.latency.summarize(), # Submit key to boom on screen, per stage
+        # Waves sent and meteors hit while measuring: 0 means the projectile phases measured nothing
+        'launches': game.latency.launches,
+        'hits': game.latency.hits,
+        'mean_entities': sum(entity_counts) / len(entity_counts) if entity_counts else 0.0,
+        # Entities allocated during the measured frames (0 once the pools are warm) and the pool counters at the end
+        'allocated': {name: pool['created'] - created_before.get(name, 0) for name, pool in pools.items()},
+        'pools': pools,
+        'score': game.score,
+    }
+
+
+def main(argv=None):
+    parser = bakunawa_cli.make_parser(__doc__)
+    parser.add_argument('--levels', type=int, nargs='+', default=[1, 10, 50, 200])
+    parser.add_argument('--difficulties', nargs='+', default=DIFFICULTIES, choices=DIFFICULTIES)
+    parser.add_argument('--frames', type=int, default=600, help='measured frames per case')
+    parser.add_argument('--warmup', type=int, default=60, help='unmeasured frames per case')
+    parser.add_argument('--type-every', type=int, default=30,
+                        help='submit an answer every N frames (at most once per gong animation, 24 frames)')
+    parser.add_argument('--render-mode', default=None, choices=['dirty', 'full'])
+    parser.add_argument('--render-backend', default=None, choices=['surface', 'texture'])
+    parser.add_argument('--render-scale', default=None, help="internal render scale (e.g. 0.5) or 'auto'")
+    parser.add_argument('--entity-backend', default=None, choices=['python', 'numpy'])
+    parser.add_argument('--launch-on-keypress', action='store_true', default=None,
+                        help='launch the sound wave on the submit key instead of after the animation')
+    parser.add_argument('--seed', type=int, default=1234)
+    parser.add_argument('--output', default='bench_results.json')
+    args = parser.parse_args(argv)
+
+    bakunawa = bakunawa_cli.import_game(args)
+
+    render_mode = args.render_mode or bakunawa.RENDER_MODE
+    render_backend = args.render_backend or bakunawa.RENDER_BACKEND
+    render_scale = args.render_scale or bakunawa.RENDER_SCALE
+    entity_backend = args.entity_backend or bakunawa.ENTITY_BACKEND
+    launch_on_keypress = args.launch_on_keypress or bakunawa.LAUNCH_ON_KEYPRESS
+    game = bakunawa.Game(render_mode=render_mode, seed=args.seed, entity_backend=entity_backend,
+                         render_backend=render_backend, render_scale=render_scale,
+                         launch_on_keypress=launch_on_keypress)
+    game.gong_sfx = None # Benchmarks stay silent
+    game.replay = None # and set the game state directly, which a replay could not reproduce
+
+    results = []
+    for name in args.difficulties:
+        for level in args.levels:
+            result = run_case(bakunawa, game, DIFFICULTIES.index(name), level, args.frames, args.warmup, args.type_every)
+            results.append(result)
+            frame = result['frame_ms']
+            print(f"{name:<11} level {level:>4}: p50 {frame['p50']:7.3f} ms  p95 {frame['p95']:7.3f} ms  "
+                  f"p99 {frame['p99']:7.3f} ms  entities {result['mean_entities']:.1f}  "
+                  f"waves {result['launches']}/{result['hits']}")
+            if not result['launches'] or not result['hits']:
+                print(f"Warning: {name} level {level}: no sound wave {'launched' if not result['launches'] else 'hit'}, "
+                      f"the launch/hit latency and projectile numbers measured nothing")
+
+    report = {
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': sys.version.split()[0],
+        'pygame': bakunawa.pygame.version.ver,
+        'platform': platform.platform(),
+        'render_mode': render_mode,
+        'render_backend': game.render_backend, # 'surface' if 'texture' was asked for but is not available
+        'render_scale': render_scale,
+        'final_render_scale': game.render_scale, # Where 'auto' ended up
+        'entity_backend': entity_backend,
+        'launch_on_keypress': launch_on_keypress,
+        'seed': args.seed,
+        'results': results,
+    }
+    with open(args.output, 'w', encoding='utf-8') as output:
+        json.dump(report, output, indent=2)
+    print(f"Wrote {args.output}")
+
+
+if __name__ == '__main__':
+    main()
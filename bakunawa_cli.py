@@ -0,0 +1,37 @@
+"""
+Command line setup shared by the Bakunawa tool scripts (bakunawa_benchmark.py, bakunawa_pack.py,
+bakunawa_replay.py, bakunawa_lexicon.py).
+
+The game module initializes pygame when it is imported, so the SDL drivers and the asset root
+have to be set before that: parse the arguments first, then call import_game().
+
+Example:
+    parser = bakunawa_cli.make_parser(__doc__)
+    parser.add_argument('--output')
+    args = parser.parse_args(argv)
+    bakunawa = bakunawa_cli.import_game(args)
+"""
+import argparse
+import importlib
+import os
+
+
+def make_parser(description):
+    """Returns an argument parser with the shared --assets option."""
+    parser = argparse.ArgumentParser(description=description, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--assets', help='asset root (sets BAKUNAWA_ASSET_PATH)')
+    return parser
+
+
+def import_game(args, headless=True):
+    """
+    Imports and returns the game module, on SDL's dummy drivers (video only when headless) and
+    with the asset root from --assets.
+    """
+    # Must be set before pygame is imported by the game module
+    if headless:
+        os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    if args.assets:
+        os.environ['BAKUNAWA_ASSET_PATH'] = args.assets
+    return importlib.import_module('bakunawa_revampe3')
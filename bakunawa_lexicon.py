@@ -0,0 +1,45 @@
+"""
+Offline lexicon builder for Bakunawa.
+
+Reads the JSON word list of each WIKA language (bakunawa_revampe3.WORD_LIST_PATHS), sorts the words
+into the difficulty buckets and writes one binary lexicon per language (LEXICON_PATH) with an offsets
+table and the accent-stripped keys precomputed. At runtime the game memory-maps those files and
+decodes a word only when it is drawn for a level, so switching languages never parses JSON.
+Each file carries a digest of its words; rebuilding an unchanged word list gives the same digest,
+so word indexes and recorded replays stay valid.
+
+The game builds a missing lexicon itself on first use; run this to ship them prebuilt, and again
+whenever a word list changes.
+
+Example:
+    python bakunawa_lexicon.py --assets "/path/to/assets" --languages Cebuano Tagalog
+"""
+import os
+import time
+
+import bakunawa_cli
+
+
+def main(argv=None):
+    parser = bakunawa_cli.make_parser(__doc__)
+    parser.add_argument('--languages', nargs='+', help='languages to build (default: every WIKA language with a word list)')
+    args = parser.parse_args(argv)
+
+    bakunawa = bakunawa_cli.import_game(args)
+
+    for language in args.languages or bakunawa.WIKA:
+        if language not in bakunawa.WIKA:
+            parser.error(f"unknown language {language}, expected one of {', '.join(bakunawa.WIKA)}")
+        source = bakunawa.WORD_LIST_PATHS[language]
+        if not os.path.exists(bakunawa.get_asset_path(source)):
+            print(f"{language:<11} skipped, no word list at {source}")
+            continue
+        output = bakunawa.get_asset_path(bakunawa.LEXICON_PATH.format(language.lower()))
+        start = time.perf_counter()
+        count = bakunawa.Lexicon.build(bakunawa.WordBank(source), output)
+        print(f"{language:<11} {count} words into {output} ({os.path.getsize(output) / 1024:.1f} KiB) "
+              f"in {time.perf_counter() - start:.2f} s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,35 @@
+"""
+Offline asset pack builder for Bakunawa.
+
+Decodes every sprite the game uses (bakunawa_revampe3.PACKED_SPRITES), scales it to the size the
+game asks for and stores the raw pixels in one indexed file. At runtime the game memory-maps that
+file and creates its surfaces straight from it, so there is no PNG decoding or scaling at startup
+and the whole sprite set is a single file on the device.
+
+Rebuild the pack whenever an image changes.
+
+Example:
+    python bakunawa_pack.py --assets "/path/to/assets"
+"""
+import os
+import time
+
+import bakunawa_cli
+
+
+def main(argv=None):
+    parser = bakunawa_cli.make_parser(__doc__)
+    parser.add_argument('--output', help='pack file to write (default: ASSET_PACK_PATH under the asset root)')
+    args = parser.parse_args(argv)
+
+    bakunawa = bakunawa_cli.import_game(args)
+
+    output = args.output or bakunawa.get_asset_path(bakunawa.ASSET_PACK_PATH)
+    start = time.perf_counter()
+    count = bakunawa.AssetPack.build(bakunawa.PACKED_SPRITES, output)
+    print(f"Packed {count} sprites into {output} ({os.path.getsize(output) / 1024 / 1024:.1f} MiB) "
+          f"in {time.perf_counter() - start:.2f} s")
+
+
+if __name__ == '__main__':
+    main()
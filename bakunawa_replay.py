@@ -0,0 +1,78 @@
+"""
+Replay runner for Bakunawa.
+
+Plays recorded sessions (.bkr files saved by the game on quit) back. By default every replay is
+run as fast as possible without rendering and its final level/score/lives are checked against the
+ones recorded, which turns a folder of replays into a regression corpus. --realtime shows a single
+replay in the game window instead, at --speed times real time.
+
+Example:
+    python bakunawa_replay.py --assets "/path/to/assets" "/path/to/assets/Bakunawa Assets/Replays"
+    python bakunawa_replay.py --assets "/path/to/assets" --realtime --speed 2 replay_20250101-120000.bkr
+"""
+import json
+import os
+import sys
+import time
+
+import bakunawa_cli
+
+
+def replay_paths(paths):
+    """Expands folders into the .bkr files they contain."""
+    found = []
+    for path in paths:
+        if os.path.isdir(path):
+            found.extend(sorted(os.path.join(path, name) for name in os.listdir(path) if name.endswith('.bkr')))
+        else:
+            found.append(path)
+    return found
+
+
+def main(argv=None):
+    parser = bakunawa_cli.make_parser(__doc__)
+    parser.add_argument('replays', nargs='+', help='replay files or folders of them')
+    parser.add_argument('--realtime', action='store_true', help='show the (first) replay in the game window')
+    parser.add_argument('--speed', type=float, default=1.0, help='playback speed for --realtime')
+    parser.add_argument('--output', help='write the results as JSON')
+    args = parser.parse_args(argv)
+
+    bakunawa = bakunawa_cli.import_game(args, headless=not args.realtime)
+
+    paths = replay_paths(args.replays)
+    if args.realtime:
+        replay = bakunawa.Replay.load(paths[0])
+        game = bakunawa.Game(seed=replay.seed)
+        game.replay = None
+        print(f"{paths[0]}: {game.play_replay(replay, args.speed)}")
+        return 0
+
+    results = []
+    failures = 0
+    for path in paths:
+        try:
+            replay = bakunawa.Replay.load(path)
+        except (OSError, ValueError) as e:
+            print(f"{path}: could not load: {e}")
+            failures += 1
+            continue
+        simulation = bakunawa.GameSimulation(seed=replay.seed)
+        start = time.perf_counter()
+        result = bakunawa.ReplayPlayer(replay, simulation).run_fast()
+        elapsed = time.perf_counter() - start
+        ok = result == tuple(replay.result)
+        failures += not ok
+        results.append({'replay': path, 'ok': ok, 'expected': list(replay.result), 'result': list(result),
+                        'ticks': simulation.tick, 'seconds': elapsed})
+        print(f"{'ok  ' if ok else 'FAIL'} {path}: level/score/lives {result} (recorded {tuple(replay.result)}), "
+              f"{simulation.tick} ticks in {elapsed:.2f} s")
+
+    print(f"{len(paths) - failures}/{len(paths)} replays reproduced")
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as output:
+            json.dump(results, output, indent=2)
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
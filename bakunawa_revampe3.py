@@ -6,22 +6,72 @@ import unicodedata
 import sys
 import os
 import math
+import time
+import hashlib
+import contextlib
+import mmap
+import struct
+import threading
+import bisect
+import itertools
+import fractions
+import weakref
+from collections import OrderedDict, deque
+
+try:
+    import numpy # Optional, only needed by the 'numpy' entity backend
+except ImportError:
+    numpy = None
+
+try:
+    from pygame._sdl2 import video as sdl2_video # Optional, only needed by the 'texture' render backend
+except ImportError:
+    sdl2_video = None
 
 # Initialization
+# A small mixer buffer (pygame's default is 512 samples), so the gong starts within a few milliseconds
+pygame.mixer.pre_init(44100, -16, 2, 256)
 pygame.init()
 pygame.key.start_text_input()
 
 # Constants
 WIDTH, HEIGHT = 1200, 700
 FPS = 60
+IDLE_FPS = 15 # Frame rate cap in the pause and game over menus, which are only redrawn on input
+FIXED_DT = 1.0 / FPS # Game logic always advances in steps of this size, whatever the frame rate
+MAX_STEPS_PER_FRAME = 5 # After a long stall, drop time instead of trying to catch up forever
+SPAWNS_PER_STEP = 2 # Most meteors created in one fixed step, the rest of a due row follows in the next steps
 LIVES_START = 7
+# Launch the sound wave and strike the gong on the submit key, with the abatang animation playing alongside,
+# instead of once the animation has played
+LAUNCH_ON_KEYPRESS = False
+PROJECTILE_SPEED = 1200 # Sound wave speed in pixels per second
+# 'dirty' restores and updates only the screen regions that changed, 'full' redraws and flips the whole frame
+RENDER_MODE = 'dirty'
+# 'surface' blits onto the display surface in software, 'texture' draws textures with pygame._sdl2's Renderer
+# (GPU accelerated when SDL has a driver for it, SDL's software renderer otherwise). RENDER_MODE only applies to 'surface'
+RENDER_BACKEND = 'surface'
+# Internal render resolution as a fraction of WIDTH x HEIGHT (e.g. 0.5 renders 600x350 and stretches it to the window),
+# or 'auto' to start at full size and step down through AUTO_SCALE_STEPS while frames run over budget (back up, and no
+# further, if a step made them no faster).
+# Needs the 'surface' backend in 'dirty' mode. Game logic, mouse and hit-testing always use logical coordinates
+RENDER_SCALE = 1.0
+AUTO_SCALE_STEPS = (1.0, 0.75, 0.5)
+AUTO_SCALE_BUDGET_MS = 1000 / FPS * 0.75 # Mean frame work (not counting the wait for the next frame) allowed per frame
+AUTO_SCALE_FRAMES = 120 # Frames averaged before the auto mode decides
+# 'python' updates words and projectiles one object at a time, 'numpy' updates them all at once in arrays (needs NumPy)
+ENTITY_BACKEND = 'python'
+# Smooth the edges of the sound wave rings with an alpha falloff. They are pre-rendered, so it costs nothing per frame
+RING_ANTIALIAS = False
+RING_SUPERSAMPLE = 4 # Anti-aliased rings are drawn this many times larger, then scaled down
 WIKA = ["Cebuano", "Ilocano", "Filipino", "Hiligaynon", "Tagalog"]
 
 # Base path for assets
 # Adjust this path based on your device's file structure.
 # For Android, it's often '/storage/emulated/0' or a subfolder within it.
 # For desktop, it's typically a relative path like './Bakunawa Assets'.
-BASE_ASSET_PATH = '/storage/emulated/0'
+# The BAKUNAWA_ASSET_PATH environment variable overrides it (e.g. for headless benchmarks).
+BASE_ASSET_PATH = os.environ.get('BAKUNAWA_ASSET_PATH', '/storage/emulated/0')
 
 def get_asset_path(relative_path):
     """Helper to construct full asset paths."""
@@ -37,30 +87,50 @@ def remove_accents(text):
         if unicodedata.category(c) != 'Mn'
     )
 
-# Load and categorize words
-try:
-    word_list_path = get_asset_path('Bakunawa Assets/Words/clean_cebuano_word_list.json')
-    if not os.path.exists(word_list_path):
-        print(f"Error: Word list file not found at {word_list_path}")
-        cebuano_words = []
-    else:
-        with open(word_list_path, 'r', encoding='utf-8') as mga_salita:
-            cebuano_words = json.load(mga_salita)
-except Exception as e:
-    print(f"Error loading word list: {e}")
-    cebuano_words = []
-
-madali_words = []
-katamtaman_words = []
-mahirap_words = []
-for word in cebuano_words:
-    wl = len(word)
-    if 4 <= wl <= 6:
-        madali_words.append(word)
-    elif 7 <= wl <= 12:
-        katamtaman_words.append(word)
-    elif 13 <= wl <= 18:
-        mahirap_words.append(word)
+LANGUAGE = 'Cebuano' # Language of the words on the meteors (one of WIKA), can be switched in game with LANGUAGE_KEY
+LANGUAGE_KEY = pygame.K_F2
+# Source word list of each language, read only to build its lexicon
+WORD_LIST_PATHS = {language: f'Bakunawa Assets/Words/clean_{language.lower()}_word_list.json' for language in WIKA}
+LEXICON_PATH = 'Bakunawa Assets/Words/{}.lex' # Binary lexicon of one language, see Lexicon and bakunawa_lexicon.py
+# Precomputed per-word data (normalized text, pixel width, fits-on-meteor), rebuilt when the inputs change
+WORD_INDEX_PATH = 'Bakunawa Assets/Words/{}.index.{}.json' # One file per language and difficulty
+WORD_FONT_PATH = 'Bakunawa Assets/Fonts/GentiumPlus-Bold.ttf'
+WORD_FONT_SIZE = 38
+DIFFICULTY_NAMES = ['madali', 'katamtaman', 'mahirap'] # Same order as Game.choices
+# Assets loaded before the first frame is shown should add up to less than this
+STARTUP_BUDGET_MS = 1000
+# Profiler: frames kept for the HUD and exports, hotkeys to show the HUD and to export the samples
+PROFILE_HISTORY = 300
+PROFILER_HUD_KEY = pygame.K_F3
+PROFILER_EXPORT_KEY = pygame.K_F4
+PROFILE_EXPORT_PATH = 'Bakunawa Assets/bakunawa_profile_{}.json'
+# Stages of an answer's way from the submit key to the boom on screen, timed by LatencyTracker
+LATENCY_STAGES = ('event', 'read', 'input', 'check', 'launch', 'hit', 'shown')
+# Every session's seed and input actions are saved here on quit, so it can be replayed exactly
+RECORD_REPLAYS = True
+REPLAY_PATH = 'Bakunawa Assets/Replays/replay_{}.bkr'
+# Optional pack of pre-decoded, pre-scaled sprites built by bakunawa_pack.py. Loose PNGs are used if it is missing.
+ASSET_PACK_PATH = 'Bakunawa Assets/bakunawa.pack'
+# Sprite paths and sizes, used both by the loaders and by PACKED_SPRITES
+BACKGROUND_PATH = 'Download/bakunawa_landscape.png'
+MOON_TANGA_PATH = 'Bakunawa Assets/Pictures/Sprites/Moon/moontanga.png'
+BULALAKAW_ASSETS = {
+    "falling": 'Bakunawa Assets/Pictures/Sprites/Bulalakaw/Falling/Bulalakaw_{}.png',
+    "boom": 'Bakunawa Assets/Pictures/Sprites/Bulalakaw/Boom/Sabog_{}.png'
+}
+BULALAKAW_FRAMES = 6 # Falling frames, and as many boom frames
+MOON_LIVES_PATHS = [f'Bakunawa Assets/Pictures/Sprites/Moon/Buwan_{i}.png' for i in range(1, 9)] # Buwan_8 is the game over image
+MOON_LIVES_SIZE = (160, 160)
+ABATANG_PATHS = [f'Bakunawa Assets/Pictures/Sprites/Tao/abatang{i}.png' for i in range(1, 5)] # Gong banging animation
+ABATANG_SIZE = (160, 160)
+# Every sprite the game loads, as (path, size or None, alpha) - exactly the SPRITE_CACHE.load() arguments
+PACKED_SPRITES = (
+    [(BACKGROUND_PATH, None, False),
+     (MOON_TANGA_PATH, None, True)]
+    + [(BULALAKAW_ASSETS[kind].format(i), None, True) for kind in ('falling', 'boom') for i in range(1, BULALAKAW_FRAMES + 1)]
+    + [(path, MOON_LIVES_SIZE, True) for path in MOON_LIVES_PATHS]
+    + [(path, ABATANG_SIZE, True) for path in ABATANG_PATHS]
+)
 
 PALETTE = {
     "teal1": (33, 140, 144),
@@ -68,27 +138,1095 @@ PALETTE = {
     "soft_red": (180, 60, 60),
 }
 
-class Bulalakaw(pygame.sprite.Sprite):
-    """Represents the falling meteorite/bulalakaw."""
+class AssetProfile:
+    """
+    Records how long every asset load took and whether it happened before the first frame was shown,
+    so slow cold starts can be traced to the files responsible.
+    """
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.records = [] # (name, milliseconds, loaded before the first frame)
+        self.first_frame_ms = None
+        self.depth = 0 # Only the outermost measure() is recorded so nested loads aren't counted twice
+
+    @contextlib.contextmanager
+    def measure(self, name):
+        """Times the enclosed load under name."""
+        start = time.perf_counter()
+        self.depth += 1
+        try:
+            yield
+        finally:
+            self.depth -= 1
+            if self.depth == 0:
+                self.records.append((name, (time.perf_counter() - start) * 1000.0, self.first_frame_ms is None))
+
+    def first_frame_shown(self):
+        """Marks the first flip(). Returns True only the first time."""
+        if self.first_frame_ms is not None:
+            return False
+        self.first_frame_ms = (time.perf_counter() - self.start) * 1000.0
+        return True
+
+    def report(self, budget_ms=STARTUP_BUDGET_MS):
+        """Returns a readable summary of the loads done before the first frame, slowest first."""
+        startup = [(name, ms) for name, ms, before in self.records if before]
+        total_ms = sum(ms for _, ms in startup)
+        lines = [f"Startup: first frame after {self.first_frame_ms or 0:.0f} ms, "
+                 f"{len(startup)} assets loaded in {total_ms:.0f} ms (budget {budget_ms} ms)"]
+        if total_ms > budget_ms:
+            lines[0] += " - OVER BUDGET"
+        for name, ms in sorted(startup, key=lambda record: -record[1]):
+            lines.append(f"  {ms:8.1f} ms  {name}")
+        return '\n'.join(lines)
+
+ASSET_PROFILE = AssetProfile()
+
+class LazyAsset:
+    """Handle to an asset that is loaded (and profiled) the first time get() is called."""
+    def __init__(self, name, loader):
+        self.name = name
+        self.loader = loader
+        self.loaded = False
+        self.value = None
+
+    def get(self):
+        """Returns the asset, loading it on first use."""
+        if not self.loaded:
+            with ASSET_PROFILE.measure(self.name):
+                self.value = self.loader()
+            self.loaded = True
+        return self.value
+
+class LazyFonts:
+    """Font table keyed by name that opens each (file, size) only the first time it is used."""
+    def __init__(self, specs):
+        self.specs = specs # Name -> (relative path, size)
+        self.fonts = {}
+
+    def __getitem__(self, name):
+        font = self.fonts.get(name)
+        if font is None:
+            path, size = self.specs[name]
+            with ASSET_PROFILE.measure(f'{path} @ {size}pt'):
+                font = pygame.font.Font(get_asset_path(path), size)
+            self.fonts[name] = font
+        return font
+
+class WordBank:
+    """A JSON word list, parsed the first time any difficulty needs it and split by word length. Lexicon.build reads it."""
+    def __init__(self, relative_path=WORD_LIST_PATHS[LANGUAGE]):
+        self.relative_path = relative_path
+        self.lists = None
+
+    def stamp(self):
+        """Cheap fingerprint of the word list file (no parsing), used to validate derived caches."""
+        try:
+            info = os.stat(get_asset_path(self.relative_path))
+        except OSError:
+            return 'missing'
+        return f'{info.st_mtime_ns}:{info.st_size}'
+
+    def words(self, name):
+        """Returns the words of a difficulty ('madali', 'katamtaman' or 'mahirap')."""
+        if self.lists is None:
+            with ASSET_PROFILE.measure(self.relative_path):
+                self.lists = self.load()
+        return self.lists[name]
+
+    def load(self):
+        """Loads and categorizes the words."""
+        try:
+            word_list_path = get_asset_path(self.relative_path)
+            if not os.path.exists(word_list_path):
+                print(f"Error: Word list file not found at {word_list_path}")
+                cebuano_words = []
+            else:
+                with open(word_list_path, 'r', encoding='utf-8') as mga_salita:
+                    cebuano_words = json.load(mga_salita)
+        except Exception as e:
+            print(f"Error loading word list: {e}")
+            cebuano_words = []
+
+        madali_words = []
+        katamtaman_words = []
+        mahirap_words = []
+        for word in cebuano_words:
+            wl = len(word)
+            if 4 <= wl <= 6:
+                madali_words.append(word)
+            elif 7 <= wl <= 12:
+                katamtaman_words.append(word)
+            elif 13 <= wl <= 18:
+                mahirap_words.append(word)
+        return {'madali': madali_words, 'katamtaman': katamtaman_words, 'mahirap': mahirap_words}
+
+class Lexicon:
+    """
+    The words of one WIKA language in a compact binary file, memory-mapped on first use. Words are only
+    decoded when asked for by id, so a language costs neither a JSON parse nor a list of strings up front.
+    If the file is missing it is built once from the language's JSON word list.
+
+    Layout (little-endian): MAGIC, a BLAKE2b digest of the rest of the file, u32 word count, a u32
+    (start, end) id range per difficulty in DIFFICULTY_NAMES order, count + 1 u32 text offsets,
+    count + 1 u32 key offsets, then the UTF-8 text blob and the blob of accent-stripped keys. Texts are
+    lowercase, grouped by difficulty in word list order. Most words have no accents; their key is
+    stored empty and means "same as the text".
+    """
+    MAGIC = b'BKLEX002'
+    DIGEST_SIZE = 16
+
+    def __init__(self, language):
+        self.language = language
+        self.name = language.lower()
+        self.relative_path = LEXICON_PATH.format(self.name)
+        self.source_path = WORD_LIST_PATHS[language]
+        self.map = None
+        self.count = 0
+        self.buckets = None # Difficulty name -> range of word ids, read on first use
+        self.content_digest = 'missing'
+
+    def available(self):
+        """True if there is a lexicon file, or a word list to build it from."""
+        return (os.path.exists(get_asset_path(self.relative_path)) or
+                os.path.exists(get_asset_path(self.source_path)))
+
+    def digest(self):
+        """
+        Fingerprint of the words, stored in the file when it was built. It only changes with the
+        contents, so derived caches and replays stay valid on other machines and across rebuilds.
+        """
+        if self.buckets is None:
+            self.open() # Builds the file if it doesn't exist yet
+        return self.content_digest
+
+    def is_current(self, path):
+        """True if path is a lexicon in this version of the format."""
+        try:
+            with open(path, 'rb') as lexicon_file:
+                return lexicon_file.read(len(self.MAGIC)) == self.MAGIC
+        except OSError:
+            return False
+
+    def open(self):
+        """Maps the lexicon and reads its header, building it first if needed. Failures leave it empty."""
+        self.buckets = {name: range(0) for name in DIFFICULTY_NAMES}
+        path = get_asset_path(self.relative_path)
+        if not self.is_current(path): # Missing, or from an older version of the game
+            if not os.path.exists(get_asset_path(self.source_path)):
+                print(f"Error: No {self.language} lexicon at {path} and no word list to build it from")
+                return
+            print(f"Building the {self.language} lexicon from {self.source_path}")
+            try:
+                self.build(WordBank(self.source_path), path)
+            except OSError as e:
+                print(f"Warning: Could not save the {self.language} lexicon to {path}: {e}")
+                return
+        try:
+            with ASSET_PROFILE.measure(self.relative_path):
+                with open(path, 'rb') as lexicon_file:
+                    self.map = mmap.mmap(lexicon_file.fileno(), 0, access=mmap.ACCESS_READ)
+                if self.map[:len(self.MAGIC)] != self.MAGIC:
+                    raise ValueError("not a Bakunawa lexicon")
+                position = len(self.MAGIC)
+                content_digest = self.map[position:position + self.DIGEST_SIZE].hex()
+                position += self.DIGEST_SIZE
+                (count,) = struct.unpack_from('<I', self.map, position)
+                position += 4
+                buckets = {}
+                for name in DIFFICULTY_NAMES:
+                    start, end = struct.unpack_from('<II', self.map, position)
+                    buckets[name] = range(start, end)
+                    position += 8
+                self.text_offsets = position
+                self.key_offsets = position + 4 * (count + 1)
+                self.text_blob = self.key_offsets + 4 * (count + 1)
+                (text_size,) = struct.unpack_from('<I', self.map, self.text_offsets + 4 * count)
+                self.key_blob = self.text_blob + text_size
+            self.count = count
+            self.buckets = buckets
+            self.content_digest = content_digest
+        except (OSError, ValueError, struct.error) as e:
+            print(f"Warning: Could not read the {self.language} lexicon {path}: {e}")
+
+    def bucket(self, name):
+        """Returns the range of word ids of a difficulty ('madali', 'katamtaman' or 'mahirap')."""
+        if self.buckets is None:
+            self.open()
+        return self.buckets[name]
+
+    def decode(self, table, blob, word_id):
+        start, end = struct.unpack_from('<II', self.map, table + 4 * word_id)
+        return self.map[blob + start:blob + end].decode('utf-8')
+
+    def text(self, word_id):
+        """Returns the (lowercase) text of a word."""
+        return self.decode(self.text_offsets, self.text_blob, word_id)
+
+    def key(self, word_id):
+        """Returns the accent-stripped text of a word, what typed input is matched against."""
+        return self.decode(self.key_offsets, self.key_blob, word_id) or self.text(word_id)
+
+    @classmethod
+    def build(cls, word_bank, output_path):
+        """Writes the lexicon of a WordBank's words. Returns the number of words."""
+        texts, buckets = [], []
+        for name in DIFFICULTY_NAMES:
+            start = len(texts)
+            texts.extend(word.lower() for word in word_bank.words(name))
+            buckets.append((start, len(texts)))
+
+        def blob_and_offsets(strings):
+            encoded = [string.encode('utf-8') for string in strings]
+            return b''.join(encoded), [0, *itertools.accumulate(len(data) for data in encoded)]
+
+        text_blob, text_offsets = blob_and_offsets(texts)
+        key_blob, key_offsets = blob_and_offsets('' if remove_accents(text) == text else remove_accents(text) for text in texts)
+        count = len(texts)
+        body = bytearray(struct.pack('<I', count))
+        for start, end in buckets:
+            body += struct.pack('<II', start, end)
+        body += struct.pack(f'<{count + 1}I', *text_offsets)
+        body += struct.pack(f'<{count + 1}I', *key_offsets)
+        body += text_blob
+        body += key_blob
+        with open(output_path, 'wb') as lexicon_file:
+            lexicon_file.write(cls.MAGIC)
+            lexicon_file.write(hashlib.blake2b(body, digest_size=cls.DIGEST_SIZE).digest())
+            lexicon_file.write(body)
+        return count
+
+LEXICONS = {language: Lexicon(language) for language in WIKA} # Each one maps its file on first use
+
+class AssetPack:
+    """
+    Single-file archive of sprites stored as raw BGRA pixels, already decoded and scaled.
+    The file is memory-mapped and every Surface is a view into the map (pygame.image.frombuffer),
+    so loading a sprite costs neither a PNG decode, a scale nor a copy.
+
+    Layout: MAGIC, little-endian u32 index length, JSON index, then the pixel blobs
+    (each aligned to BLOB_ALIGN bytes from the start of the file).
+    """
+    MAGIC = b'BKPACK01'
+    PIXEL_FORMAT = 'BGRA' # Same byte order as the usual 32-bit (X)RGB8888 display surface, so blits need no conversion
+    BLOB_ALIGN = 64
+
+    def __init__(self, relative_path=ASSET_PACK_PATH):
+        self.relative_path = relative_path
+        self.entries = None # (path, size, alpha) -> (offset, width, height), read on first use
+        self.map = None
+        self.view = None
+
+    @staticmethod
+    def entry_key(relative_path, size, alpha):
+        return (relative_path, tuple(size) if size is not None else None, bool(alpha))
+
+    def open(self):
+        """Maps the pack and reads its index. A missing or unreadable pack just leaves it empty."""
+        self.entries = {}
+        path = get_asset_path(self.relative_path)
+        if not os.path.exists(path):
+            return
+        try:
+            with ASSET_PROFILE.measure(self.relative_path):
+                with open(path, 'rb') as pack_file:
+                    self.map = mmap.mmap(pack_file.fileno(), 0, access=mmap.ACCESS_READ)
+                header_size = len(self.MAGIC) + 4
+                if self.map[:len(self.MAGIC)] != self.MAGIC:
+                    raise ValueError("not a Bakunawa asset pack")
+                (index_size,) = struct.unpack_from('<I', self.map, len(self.MAGIC))
+                index = json.loads(self.map[header_size:header_size + index_size].decode('utf-8'))
+                if index.get('pixel_format') != self.PIXEL_FORMAT:
+                    raise ValueError(f"unsupported pixel format {index.get('pixel_format')}")
+                self.view = memoryview(self.map)
+                for relative_path, size, alpha, offset, width, height in index['entries']:
+                    self.entries[self.entry_key(relative_path, size, alpha)] = (offset, width, height)
+        except (OSError, ValueError, struct.error) as e:
+            print(f"Warning: Could not read asset pack {path}, using loose files: {e}")
+            self.entries = {}
+
+    def contains(self, relative_path, size=None, alpha=True):
+        """True if the pack has the sprite for these SPRITE_CACHE.load() arguments."""
+        if self.entries is None:
+            self.open()
+        return self.entry_key(relative_path, size, alpha) in self.entries
+
+    def surface(self, relative_path, size=None, alpha=True):
+        """Returns the packed surface for these SPRITE_CACHE.load() arguments, or None if it isn't packed."""
+        if self.entries is None:
+            self.open()
+        entry = self.entries.get(self.entry_key(relative_path, size, alpha))
+        if entry is None:
+            return None
+        offset, width, height = entry
+        surface = pygame.image.frombuffer(self.view[offset:offset + width * height * 4], (width, height), self.PIXEL_FORMAT)
+        display = pygame.display.get_surface()
+        if display is not None and not alpha:
+            surface = surface.convert() # Opaque images drop the alpha channel so they blit without blending
+        elif display is not None and surface.get_masks()[:3] != display.get_masks()[:3]:
+            surface = surface.convert_alpha() # Unusual display format, fall back to a converted copy
+        return surface
+
+    @classmethod
+    def build(cls, sprites, output_path):
+        """
+        Writes a pack containing sprites, a list of (path, size, alpha) load arguments.
+        Images are decoded and scaled exactly as SpriteCache does it. Returns the number of packed sprites.
+        """
+        cache = SpriteCache(pack=None) # Loose files only, never the pack being rebuilt
+        blobs = []
+        for relative_path, size, alpha in sprites:
+            surface = cache.load(relative_path, size, alpha)
+            blobs.append((relative_path, size, alpha, surface.get_size(),
+                          pygame.image.tobytes(surface, cls.PIXEL_FORMAT)))
+
+        def aligned(position):
+            return -(-position // cls.BLOB_ALIGN) * cls.BLOB_ALIGN
+
+        # Offsets depend on the index length, which depends on the offsets: settle it with a few passes
+        header_size = len(cls.MAGIC) + 4
+        index_bytes = b''
+        for _ in range(4):
+            offset = aligned(header_size + len(index_bytes))
+            entries = []
+            for relative_path, size, alpha, (width, height), pixels in blobs:
+                entries.append([relative_path, list(size) if size else None, alpha, offset, width, height])
+                offset = aligned(offset + len(pixels))
+            new_index_bytes = json.dumps({'pixel_format': cls.PIXEL_FORMAT, 'entries': entries}).encode('utf-8')
+            if len(new_index_bytes) == len(index_bytes):
+                break
+            index_bytes = new_index_bytes
+
+        with open(output_path, 'wb') as pack_file:
+            pack_file.write(cls.MAGIC + struct.pack('<I', len(index_bytes)) + index_bytes)
+            for entry, (_, _, _, _, pixels) in zip(entries, blobs):
+                pack_file.write(b'\0' * (entry[3] - pack_file.tell()))
+                pack_file.write(pixels)
+        return len(blobs)
+
+ASSET_PACK = AssetPack()
+
+class SurfaceScaler:
+    """
+    Variants of the drawn surfaces at the internal render scale. Sprite loaders register how to rebuild their
+    surface at another scale, so sprites are pre-scaled from their original pixels when loaded (and again when
+    the scale changes). Anything else, like rendered text, is scaled the first time it is drawn.
+    """
+    def __init__(self):
+        self.factor = 1.0
+        self.builders = weakref.WeakKeyDictionary() # Logical surface -> builder(factor) of its variant
+        self.variants = weakref.WeakKeyDictionary() # Logical surface -> its variant at self.factor
+
+    @staticmethod
+    def scaled_size(size, factor):
+        """Returns size (width, height) scaled by factor, at least 1x1."""
+        return (max(1, round(size[0] * factor)), max(1, round(size[1] * factor)))
+
+    def register(self, surface, builder):
+        """Records builder(factor) as the way to scale surface, and builds its variant now unless at full size."""
+        self.builders[surface] = builder
+        if self.factor != 1.0:
+            self.variants[surface] = builder(self.factor)
+
+    def scaled(self, surface):
+        """Returns the variant of surface at the current factor (surface itself at full size)."""
+        if self.factor == 1.0 or not surface.get_width() or not surface.get_height():
+            return surface
+        variant = self.variants.get(surface)
+        if variant is None:
+            builder = self.builders.get(surface)
+            if builder is not None:
+                variant = builder(self.factor)
+            else:
+                size = self.scaled_size(surface.get_size(), self.factor)
+                try:
+                    variant = pygame.transform.smoothscale(surface, size)
+                except ValueError: # smoothscale only takes 24 and 32 bit surfaces
+                    variant = pygame.transform.scale(surface, size)
+            self.variants[surface] = variant
+        return variant
+
+    def set_factor(self, factor):
+        """Switches to another scale and rebuilds the variants of the registered surfaces."""
+        self.factor = factor
+        self.variants = weakref.WeakKeyDictionary()
+        if factor != 1.0:
+            for surface, builder in list(self.builders.items()):
+                self.variants[surface] = builder(factor)
+
+SURFACE_SCALER = SurfaceScaler()
+
+class SpriteCache:
+    """
+    Process-wide cache of loaded sprite surfaces, keyed by asset path and scale.
+    Every caller gets the same Surface object back, so a sprite is only decoded from disk once.
+    Sprites found in the asset pack are taken from it and never touch the PNG files.
+    """
+    def __init__(self, pack=ASSET_PACK):
+        self.pack = pack
+        self.surfaces = {}
+        self.sequences = {}
+        self.hits = 0
+        self.misses = 0
+        self.disk_loads = 0
+        self.pack_loads = 0
+
+    def load(self, relative_path, size=None, alpha=True):
+        """Returns the surface for relative_path, scaled to size (width, height) if given."""
+        key = (relative_path, size, alpha)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            return surface
+
+        surface = self.fetch(relative_path, size, alpha)
+        # Below full render scale the sprite is drawn from a variant scaled from the original pixels, not from this one
+        logical_size = size or surface.get_size()
+        SURFACE_SCALER.register(surface, lambda factor: self.variant(relative_path, logical_size, alpha, factor, key))
+        return surface
+
+    def variant(self, relative_path, size, alpha, factor, logical_key):
+        """Returns the sprite at size scaled by factor, cached like any other size."""
+        scaled = SURFACE_SCALER.scaled_size(size, factor)
+        key = (relative_path, scaled, alpha)
+        surface = self.surfaces.get(key)
+        if surface is None:
+            if self.pack_has(relative_path, scaled, alpha) or self.has_original(relative_path, alpha):
+                surface = self.fetch(relative_path, scaled, alpha)
+            else:
+                # Packed at its logical size only and no PNG next to it: scale the packed sprite instead
+                self.misses += 1
+                surface = pygame.transform.scale(self.surfaces[logical_key], scaled)
+                self.surfaces[key] = surface
+        return surface
+
+    def pack_has(self, relative_path, size, alpha):
+        """True if the asset pack holds the sprite at this size."""
+        return self.pack is not None and self.pack.contains(relative_path, size, alpha)
+
+    def has_original(self, relative_path, alpha):
+        """True if the sprite's original pixels can be had: cached, packed unscaled, or from the file."""
+        return ((relative_path, None, alpha) in self.surfaces or self.pack_has(relative_path, None, alpha)
+                or os.path.exists(get_asset_path(relative_path)))
+
+    def fetch(self, relative_path, size, alpha):
+        """Loads a surface that isn't cached yet (from the pack, the cached original or the file) and caches it."""
+        self.misses += 1
+        surface = self.pack.surface(relative_path, size, alpha) if self.pack is not None else None
+        if surface is not None:
+            self.pack_loads += 1 # Already decoded and scaled by the pack builder
+        elif size is not None:
+            # Scaled variants are built from the cached original so the file is still decoded only once
+            original = self.surfaces.get((relative_path, None, alpha))
+            if original is None:
+                original = self.fetch(relative_path, None, alpha)
+            surface = pygame.transform.scale(original, size)
+        else:
+            with ASSET_PROFILE.measure(relative_path):
+                surface = pygame.image.load(get_asset_path(relative_path))
+                if pygame.display.get_surface() is not None: # Headless simulations have no display to convert to
+                    surface = surface.convert_alpha() if alpha else surface.convert()
+            self.disk_loads += 1
+        self.surfaces[(relative_path, size, alpha)] = surface
+        return surface
+
+    def load_sequence(self, relative_paths, size=None, alpha=True):
+        """Returns a shared list of surfaces (e.g. animation frames) for the given paths."""
+        key = (tuple(relative_paths), size, alpha)
+        frames = self.sequences.get(key)
+        if frames is not None:
+            self.hits += 1
+            return frames
+
+        self.misses += 1
+        frames = [self.load(path, size, alpha) for path in relative_paths]
+        self.sequences[key] = frames
+        return frames
+
+    def stats(self):
+        """Returns hit/miss counters so callers can check that no disk I/O happened."""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'disk_loads': self.disk_loads,
+            'pack_loads': self.pack_loads,
+            'entries': len(self.surfaces),
+        }
+
+SPRITE_CACHE = SpriteCache()
+
+class TextCache:
+    """
+    LRU cache of rendered text surfaces, keyed by (font, text, color).
+    Font.render is one of the most expensive calls per frame, so labels and words share this.
+    """
+    def __init__(self, max_entries=1024):
+        self.surfaces = OrderedDict()
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, color, antialias=True):
+        """Returns a (shared, do not modify) surface with text rendered in font and color."""
+        key = (font, text, tuple(color), antialias)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_entries:
+            self.surfaces.popitem(last=False) # Evict the least recently used entry
+        return surface
+
+    def stats(self):
+        """Returns hit/miss counters and the current number of cached surfaces."""
+        return {'hits': self.hits, 'misses': self.misses, 'entries': len(self.surfaces)}
+
+TEXT_CACHE = TextCache()
+
+class RingCache:
+    """
+    Pre-rendered hollow circles for the sound wave projectiles. A wave's radius only takes the integer
+    values of base_radius +/- fluctuation_magnitude over its phase, so that whole set is rendered once per
+    (radius range, thickness, color) and drawing a wave becomes a single blit.
+    """
+    def __init__(self, antialias=RING_ANTIALIAS):
+        self.antialias = antialias
+        self.sets = {}
+
+    def rings(self, min_radius, max_radius, thickness, color):
+        """Returns the (shared) ring surfaces for min_radius..max_radius, indexed by radius - min_radius."""
+        key = (min_radius, max_radius, thickness, tuple(color))
+        rings = self.sets.get(key)
+        if rings is None:
+            rings = [self.render(radius, thickness, color) for radius in range(min_radius, max_radius + 1)]
+            self.sets[key] = rings
+        return rings
+
+    def render(self, radius, thickness, color):
+        """Renders one ring centered on (radius, radius) of its surface."""
+        size = radius * 2 + 1
+        if not self.antialias:
+            ring = pygame.Surface((size, size), pygame.SRCALPHA)
+            pygame.draw.circle(ring, color, (radius, radius), radius, thickness)
+            return ring
+        # Coverage becomes alpha: transparent pixels carry the ring color so the edges don't darken
+        scale = RING_SUPERSAMPLE
+        large = pygame.Surface((size * scale, size * scale), pygame.SRCALPHA)
+        large.fill((*color[:3], 0))
+        center = radius * scale + scale // 2
+        pygame.draw.circle(large, color, (center, center), radius * scale, thickness * scale)
+        return pygame.transform.smoothscale(large, (size, size))
+
+    def stats(self):
+        """Returns the number of ring sets and surfaces cached."""
+        return {'sets': len(self.sets), 'surfaces': sum(len(rings) for rings in self.sets.values())}
+
+RING_CACHE = RingCache()
+
+class PhaseTimer:
+    """
+    Measures wall time per named phase of a frame (e.g. 'draw_screen', 'flip').
+    The last PROFILE_HISTORY frames are kept in ring buffers for the profiler HUD and exports.
+    Disabled by default: scope() then returns a shared no-op context, so the hot loop stays instrumented for free.
+    """
+    NULL_SCOPE = contextlib.nullcontext()
+
+    def __init__(self, enabled=False, history=PROFILE_HISTORY):
+        self.enabled = enabled
+        self.current = {} # Phase name -> seconds spent in it during the current frame
+        self.frames = deque(maxlen=history) # One dict per finished frame, oldest dropped first
+        self.frame_times = deque(maxlen=history) # Seconds between consecutive end_frame() calls
+        self.last_frame_end = None
+
+    @contextlib.contextmanager
+    def _measure(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.current[name] = self.current.get(name, 0.0) + time.perf_counter() - start
+
+    def scope(self, name):
+        """Returns a context manager timing the enclosed block under name."""
+        if not self.enabled:
+            return self.NULL_SCOPE
+        return self._measure(name)
+
+    def end_frame(self):
+        """Closes the current frame's measurements."""
+        if not self.enabled:
+            self.last_frame_end = None
+            return
+        self.frames.append(self.current)
+        self.current = {}
+        now = time.perf_counter()
+        if self.last_frame_end is not None:
+            self.frame_times.append(now - self.last_frame_end)
+        self.last_frame_end = now
+
+    def samples(self):
+        """Returns phase name -> list of milliseconds, one per kept frame (0 where the phase did not run)."""
+        frames = list(self.frames)
+        names = sorted(set().union(*frames)) if frames else []
+        return {name: [frame.get(name, 0.0) * 1000.0 for frame in frames] for name in names}
+
+    @staticmethod
+    def summarize(values_ms):
+        """Returns mean, p50, p95 and max of a list of milliseconds."""
+        if not values_ms:
+            return {'mean': 0.0, 'p50': 0.0, 'p95': 0.0, 'max': 0.0}
+        ordered = sorted(values_ms)
+        last = len(ordered) - 1
+        return {
+            'mean': sum(ordered) / len(ordered),
+            'p50': ordered[round(0.50 * last)],
+            'p95': ordered[round(0.95 * last)],
+            'max': ordered[-1],
+        }
+
+    def export(self, path, extra=None):
+        """Writes the kept samples (and their summaries) as JSON for offline analysis."""
+        samples = self.samples()
+        frame_ms = [seconds * 1000.0 for seconds in self.frame_times]
+        data = {
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'frames': len(self.frames),
+            'frame_ms': frame_ms,
+            'phases_ms': samples,
+            'summary': {'frame': self.summarize(frame_ms),
+                        **{name: self.summarize(values) for name, values in samples.items()}},
+        }
+        if extra:
+            data.update(extra)
+        with open(path, 'w', encoding='utf-8') as export_file:
+            json.dump(data, export_file, indent=1)
+
+class LatencyTracker:
+    """
+    Timestamps each answer on its way to visual feedback: 'event' (the earliest the submit key can
+    have been queued), 'read' (the key taken from SDL's queue), 'input' (the key handled), 'check'
+    (check_answer matched a word), 'launch' (its sound wave sent), 'hit' (the wave reached it) and
+    'shown' (the first frame with the boom presented). The last `history` latencies of every stage,
+    in ms since 'event', are kept.
+
+    pygame doesn't expose SDL's event timestamps, so 'event' is the previous read of the queue:
+    'read' is then an upper bound of the time the key waited there (frame sleep and work included).
+    """
+    def __init__(self, history=PROFILE_HISTORY):
+        self.latencies = {stage: deque(maxlen=history) for stage in LATENCY_STAGES[1:]}
+        self.submit = None # Stamps of the submit key being handled, until check_answer takes them
+        self.pending = {} # (word, generation) -> stamps of the answers in flight
+        self.launches = 0 # Answers whose wave was sent
+        self.hits = 0 # Answers whose wave reached the meteor
+
+    def submitting(self, queued_after, read_at):
+        """Called right before a submit key is handled, with the window it was queued in."""
+        self.submit = {'event': queued_after, 'read': read_at, 'input': time.perf_counter()}
+
+    def submitted(self):
+        """Called after the submit key was handled. An answer that matched nothing is dropped."""
+        self.submit = None
+
+    def answered(self, word):
+        """check_answer matched word."""
+        if self.submit is not None:
+            self.submit['check'] = time.perf_counter()
+            self.pending[(word, word.generation)] = self.submit
+            self.submit = None
+
+    def launched(self, word):
+        """A sound wave was sent at word."""
+        stamps = self.pending.get((word, word.generation))
+        if stamps is not None and 'launch' not in stamps:
+            stamps['launch'] = time.perf_counter()
+            self.launches += 1
+
+    def poll_hits(self):
+        """After the simulation steps: stamps the answers whose word was hit, drops those whose word is gone."""
+        now = time.perf_counter()
+        for key, stamps in list(self.pending.items()):
+            word, generation = key
+            if word.generation != generation:
+                del self.pending[key] # Missed or cleared before any hit
+            elif 'hit' not in stamps and word.hit_by_projectile:
+                stamps['hit'] = now
+                self.hits += 1
+
+    def presented(self):
+        """After a frame was presented: completes the answers whose boom it showed."""
+        now = time.perf_counter()
+        for key, stamps in list(self.pending.items()):
+            if 'hit' in stamps:
+                stamps['shown'] = now
+                del self.pending[key]
+                for stage in LATENCY_STAGES[1:]:
+                    if stage in stamps:
+                        self.latencies[stage].append((stamps[stage] - stamps['event']) * 1000.0)
+
+    def summarize(self):
+        """Returns mean/p50/p95/max of each stage's latency since 'event', in ms."""
+        return {stage: PhaseTimer.summarize(list(values)) for stage, values in self.latencies.items()}
+
+class WordIndex:
+    """
+    The words of each difficulty that fit on a meteor, as (lexicon word id, pixel width in the word font).
+    A difficulty is measured once and saved to WORD_INDEX_PATH; later runs load just that file, so no
+    word has to be decoded or measured until it is drawn from the bag.
+    """
+    VERSION = 3
+
+    def __init__(self, lexicon, font, font_id, max_text_width):
+        self.lexicon = lexicon
+        self.font = font
+        self.max_text_width = max_text_width
+        # Everything the index depends on, to detect a stale file
+        self.key = f'{self.VERSION}|{lexicon.relative_path}|{lexicon.digest()}|{font_id}|{max_text_width}'
+        self.entries = {} # Difficulty name -> list of [word id, width], loaded on first use
+
+    def build(self, name):
+        """Measures every word of a difficulty. font.size() gives the rendered width without creating a surface."""
+        rows = []
+        for word_id in self.lexicon.bucket(name):
+            width = self.font.size(self.lexicon.text(word_id).upper())[0]
+            if width <= self.max_text_width:
+                rows.append([word_id, width])
+        return rows
+
+    def load(self, name):
+        """Loads a difficulty from its file if it matches the inputs, otherwise builds and saves it."""
+        relative_path = WORD_INDEX_PATH.format(self.lexicon.name, name)
+        path = get_asset_path(relative_path)
+        try:
+            with ASSET_PROFILE.measure(relative_path):
+                with open(path, 'r', encoding='utf-8') as index_file:
+                    data = json.load(index_file)
+            if data.get('key') == self.key:
+                return data['entries']
+        except (OSError, ValueError):
+            pass # Missing or unreadable, rebuild below
+
+        rows = self.build(name)
+        try:
+            with open(path, 'w', encoding='utf-8') as index_file:
+                json.dump({'key': self.key, 'entries': rows}, index_file)
+        except OSError as e:
+            print(f"Warning: Could not save word index to {path}: {e}")
+        return rows
+
+    def fitting(self, name):
+        """Returns (word id, width) of the words of a difficulty that fit on a meteor."""
+        if name not in self.entries:
+            self.entries[name] = self.load(name)
+        return [(word_id, width) for word_id, width in self.entries[name]]
+
+class FreeIntervals:
+    """
+    Free integer positions on a line, kept as sorted, disjoint [start, end] intervals with running
+    totals of their lengths, so a position can be drawn uniformly from all free space with one bisect.
+    """
+    def __init__(self, start, end):
+        self.intervals = [(start, end)] if start <= end else []
+        self.totals = []
+        self.rebuild_totals()
+
+    def rebuild_totals(self):
+        self.totals = list(itertools.accumulate(end - start + 1 for start, end in self.intervals))
+
+    def free_count(self):
+        """Number of free positions left."""
+        return self.totals[-1] if self.totals else 0
+
+    def sample(self, rng):
+        """Returns a uniformly drawn free position (there must be one)."""
+        k = rng.randrange(self.free_count())
+        i = bisect.bisect_right(self.totals, k)
+        start, _ = self.intervals[i]
+        return start + k - (self.totals[i - 1] if i else 0)
+
+    def remove(self, start, end):
+        """Marks [start, end] as taken."""
+        # Only the intervals between these two overlap the removed range
+        first = bisect.bisect_left(self.intervals, (start, start))
+        if first and self.intervals[first - 1][1] >= start:
+            first -= 1
+        last = bisect.bisect_right(self.intervals, (end, math.inf))
+        kept = []
+        for interval_start, interval_end in self.intervals[first:last]:
+            if interval_start < start:
+                kept.append((interval_start, min(interval_end, start - 1)))
+            if interval_end > end:
+                kept.append((max(interval_start, end + 1), interval_end))
+        self.intervals[first:last] = kept
+        self.rebuild_totals()
+
+class ShuffleBag:
+    """Hands out items in random order without repeating any until all of them were drawn once."""
+    def __init__(self, items, rng):
+        self.items = list(items)
+        self.rng = rng
+        self.remaining = []
+
+    def draw(self):
+        """Returns the next item, refilling (reshuffled) once the bag is empty."""
+        if not self.remaining:
+            self.remaining = self.items[:]
+            self.rng.shuffle(self.remaining)
+        return self.remaining.pop()
+
+    def __len__(self):
+        return len(self.items)
+
+def swap_remove(items, index):
+    """Removes items[index] in O(1) by moving the last item into its place (order is not kept)."""
+    last = items.pop()
+    if index < len(items):
+        items[index] = last
+
+class SpatialHash:
+    """
+    Uniform grid broadphase: maps each cell_size x cell_size cell to the objects whose rect overlaps it,
+    so a query only looks at the objects near the given rect instead of all of them.
+    """
+    def __init__(self, cell_size=128):
+        self.cell_size = cell_size
+        self.cells = {}
+
+    def clear(self):
+        """Removes every object."""
+        self.cells.clear()
+
+    def cell_keys(self, rect):
+        """Yields the (column, row) of every cell rect overlaps."""
+        size = self.cell_size
+        for column in range(rect.left // size, (rect.right - 1) // size + 1):
+            for row in range(rect.top // size, (rect.bottom - 1) // size + 1):
+                yield column, row
+
+    def insert(self, obj, rect):
+        """Adds obj to every cell its rect overlaps."""
+        for key in self.cell_keys(rect):
+            self.cells.setdefault(key, []).append(obj)
+
+    def query(self, rect):
+        """Returns the objects sharing at least one cell with rect (candidates, not confirmed hits)."""
+        found = []
+        seen = set()
+        for key in self.cell_keys(rect):
+            for obj in self.cells.get(key, ()):
+                if id(obj) not in seen:
+                    seen.add(id(obj))
+                    found.append(obj)
+        return found
+
+class TrieNode:
+    """A node of the WordMatcher trie. words holds every on-screen Word whose text passes through it."""
+    def __init__(self):
+        self.children = {}
+        self.words = {} # Used as an insertion-ordered set
+        self.complete = {} # Words whose normalized text ends exactly at this node
+
+class WordMatcher:
+    """
+    Incremental prefix matcher over the accent-normalized texts of the on-screen words.
+    Typing advances a cursor one trie node per letter and backspace pops it, so highlighting
+    and submitting cost the same no matter how many meteors are falling.
+    """
+    def __init__(self):
+        self.root = TrieNode()
+        self.cursor = [self.root] # cursor[i] is the node after the first i typed characters (None = no match)
+        self.pieces = [] # Normalized text contributed by each typed character, to re-walk the cursor
+        self.typed_text = '' # Concatenation of pieces
+        self.highlighted = {}
+
+    def add_words(self, words):
+        """Inserts words into the trie."""
+        for word in words:
+            node = self.root
+            node.words[word] = None
+            for char in word.normalized_text:
+                node = node.children.setdefault(char, TrieNode())
+                node.words[word] = None
+            node.complete[word] = None
+        # New nodes may now exist under the current input, so walk the cursor again
+        self.rewalk()
+
+    def remove_word(self, word):
+        """Removes a word from the trie, pruning branches that no longer lead to any word."""
+        node = self.root
+        node.words.pop(word, None)
+        path = [] # (parent, char, child) along the word
+        for char in word.normalized_text:
+            child = node.children.get(char)
+            if child is None:
+                break
+            child.words.pop(word, None) # From every node, the cursor may sit below the pruned branch
+            path.append((node, char, child))
+            node = child
+        else:
+            node.complete.pop(word, None)
+        for parent, char, child in path:
+            if not child.words:
+                del parent.children[char] # Nothing below this node is on screen anymore
+                break
+        self.highlighted.pop(word, None)
+        # The cursor may point into the pruned branch, walk it again over the live trie
+        self.rewalk()
+
+    def clear(self):
+        """Forgets every word (the typed input is kept)."""
+        self.root = TrieNode()
+        self.highlighted = {}
+        self.rewalk()
+
+    def push(self, text):
+        """Advances the cursor by the typed text (one cursor entry per typed character)."""
+        for char in text:
+            piece = remove_accents(char.lower())
+            node = self.cursor[-1]
+            for normalized_char in piece:
+                node = node.children.get(normalized_char) if node is not None else None
+            self.cursor.append(node)
+            self.pieces.append(piece)
+            self.typed_text += piece
+        self.refresh_highlight()
+
+    def pop(self):
+        """Retracts the cursor by one typed character (backspace)."""
+        if len(self.cursor) > 1:
+            self.cursor.pop()
+            piece = self.pieces.pop()
+            if piece:
+                self.typed_text = self.typed_text[:-len(piece)]
+        self.refresh_highlight()
+
+    def reset_input(self):
+        """Clears the typed input, e.g. after the word is submitted."""
+        self.cursor = [self.root]
+        self.pieces = []
+        self.typed_text = ''
+        self.refresh_highlight()
+
+    def rewalk(self):
+        """Rebuilds the cursor from the typed pieces after the trie changed under it."""
+        self.cursor = [self.root]
+        for piece in self.pieces:
+            node = self.cursor[-1]
+            for normalized_char in piece:
+                node = node.children.get(normalized_char) if node is not None else None
+            self.cursor.append(node)
+        self.refresh_highlight()
+
+    def matching_words(self):
+        """Returns the words whose normalized text starts with the typed input."""
+        node = self.cursor[-1]
+        if node is None or not self.typed_text:
+            return {}
+        return node.words
+
+    def refresh_highlight(self):
+        """Updates the highlighted prefix only of the words that start or stop matching."""
+        matching = self.matching_words()
+        typed_len = len(self.cursor) - 1
+        for word in self.highlighted:
+            if word not in matching:
+                word.set_match_len(0)
+        for word in matching:
+            word.set_match_len(min(typed_len, len(word.display_text)))
+        self.highlighted = dict(matching)
+
+    def find(self, text):
+        """Returns the words whose normalized text is exactly text (normalized here)."""
+        normalized = remove_accents(text.lower())
+        if normalized == self.typed_text:
+            node = self.cursor[-1]
+        else:
+            node = self.root
+            for char in normalized:
+                node = node.children.get(char)
+                if node is None:
+                    break
+        if node is None or not normalized:
+            return []
+        return list(node.complete)
+
+class EntityPool:
+    """
+    Free list of reusable entities of one class. acquire() resets a released instance instead of
+    allocating a new one, so once a few levels have been played the game creates no new entities.
+    Pooled classes provide reset(...) (same arguments as __init__) and release() (drop references).
+    """
+    def __init__(self, cls):
+        self.cls = cls
+        self.free = []
+        self.live = 0
+        self.high_water = 0 # Most instances live at once
+        self.created = 0
+
+    def acquire(self, *args, **kwargs):
+        """Returns a ready instance, reused if one is free."""
+        if self.free:
+            obj = self.free.pop()
+            obj.reset(*args, **kwargs)
+        else:
+            obj = self.cls(*args, **kwargs)
+            self.created += 1
+        self.live += 1
+        if self.live > self.high_water:
+            self.high_water = self.live
+        return obj
+
+    def release(self, obj):
+        """Gives an instance back. The caller must not use it afterwards."""
+        obj.release()
+        self.live -= 1
+        self.free.append(obj)
+
+    def stats(self):
+        """Returns the pool counters (created stays flat when nothing is allocated)."""
+        return {
+            'live': self.live,
+            'free': len(self.free),
+            'high_water': self.high_water,
+            'created': self.created,
+        }
+
+class Bulalakaw:
+    """Represents the falling meteorite/bulalakaw. Pooled through BULALAKAW_POOL."""
+    __slots__ = ('sprites', 'booming', 'current_sprite', 'image', 'rect', 'animation_speed', 'animation_timer')
+
     def __init__(self, pos_x, pos_y, asset_paths):
-        super().__init__()
-        self.sprites = []
+        self.rect = pygame.Rect(0, 0, 0, 0) # Kept for the life of the object, only moved by reset()
+        self.reset(pos_x, pos_y, asset_paths)
+
+    def reset(self, pos_x, pos_y, asset_paths):
+        """(Re)initializes the bulalakaw at the given top-left position."""
+        # Frames are shared by every Bulalakaw through the sprite cache, never copied
+        self.sprites = self.load_frames(asset_paths)
         self.booming = False
-        # Load falling animation frames
-        for i in range(1, 7):
-            img = pygame.image.load(get_asset_path(asset_paths['falling'].format(i))).convert_alpha()
-            self.sprites.append(img)
-        # Load boom animation frames
-        for i in range(1, 7):
-            img = pygame.image.load(get_asset_path(asset_paths['boom'].format(i))).convert_alpha()
-            self.sprites.append(img)
 
         self.current_sprite = 0
         self.image = self.sprites[self.current_sprite]
-        self.rect = self.image.get_rect(topleft=(pos_x, pos_y))
+        self.rect.size = self.image.get_size()
+        self.rect.topleft = (pos_x, pos_y)
         self.animation_speed = 10.0
         self.animation_timer = 0.0
 
+    def release(self):
+        """Nothing to drop, the frames are shared."""
+        pass
+
+    @staticmethod
+    def load_frames(asset_paths):
+        """Returns the falling frames followed by the boom frames."""
+        paths = [asset_paths['falling'].format(i) for i in range(1, BULALAKAW_FRAMES + 1)]
+        paths += [asset_paths['boom'].format(i) for i in range(1, BULALAKAW_FRAMES + 1)]
+        return SPRITE_CACHE.load_sequence(paths)
+
     def boom(self):
         """Starts the boom animation."""
         self.booming = True
@@ -115,13 +1253,28 @@ class Bulalakaw(pygame.sprite.Sprite):
         self.image = self.sprites[self.current_sprite]
         return False # Indicate that booming is not yet complete or not booming
 
+BULALAKAW_POOL = EntityPool(Bulalakaw)
+
 class SoundWaveProjectile:
-    """Represents a sound wave projectile (hollow circle) that travels and fluctuates."""
-    def __init__(self, xpos, ypos, target_x, target_y, speed=25, base_radius=30, thickness=4, color=(255, 255, 255)):
+    """Represents a sound wave projectile (hollow circle) that travels and fluctuates. Pooled through PROJECTILE_POOL."""
+    __slots__ = ('x', 'y', 'target_x', 'target_y', 'target', 'target_generation', 'speed', 'base_radius', 'thickness',
+                 'color', 'dx', 'dy', 'done', 'animation_timer', 'animation_speed', 'fluctuation_magnitude',
+                 'current_radius', 'min_radius', 'rings', 'rect', 'store_index')
+
+    def __init__(self, xpos, ypos, target_x, target_y, speed=25, base_radius=30, thickness=4, color=(255, 255, 255), target=None):
+        self.rect = pygame.Rect(0, 0, 0, 0) # Kept for the life of the object, resized and moved in place
+        self.store_index = -1 # Row in the EntityStore, if the numpy backend is used
+        self.reset(xpos, ypos, target_x, target_y, speed, base_radius, thickness, color, target)
+
+    def reset(self, xpos, ypos, target_x, target_y, speed=25, base_radius=30, thickness=4, color=(255, 255, 255), target=None):
+        """(Re)initializes the projectile to travel from (xpos, ypos) towards (target_x, target_y)."""
         self.x = float(xpos) # Use floats for smoother movement
         self.y = float(ypos)
         self.target_x = target_x
         self.target_y = target_y
+        self.target = target # The Word this wave was sent at, the only one it has to be tested against
+        # Words are pooled too: the target only counts while it is still the same word it was sent at
+        self.target_generation = target.generation if target is not None else None
         self.speed = speed # Speed at which the projectile travels (pixels per second, since scaled by delta_time)
         self.base_radius = base_radius # Core size of the hollow circle
         self.thickness = thickness # Thickness of the circle line
@@ -144,14 +1297,28 @@ class SoundWaveProjectile:
         self.animation_speed = 30.0 # How fast the fluctuation cycles
         self.fluctuation_magnitude = 5 # How much the radius fluctuates (+/- pixels)
 
+        # Every radius the fluctuation can reach, pre-rendered (same clamp as in update)
+        self.min_radius = max(self.thickness, int(self.base_radius - self.fluctuation_magnitude))
+        max_radius = max(self.thickness, int(self.base_radius + self.fluctuation_magnitude))
+        self.rings = RING_CACHE.rings(self.min_radius, max_radius, self.thickness, self.color)
+
         # Initialize rect for collision, centered at current position
         self.current_radius = self.base_radius
-        self.rect = pygame.Rect(0, 0, self.current_radius * 2, self.current_radius * 2)
+        self.rect.size = (self.current_radius * 2, self.current_radius * 2)
         self.rect.center = (int(self.x), int(self.y))
 
+    def release(self):
+        """Drops the reference to the target word."""
+        self.target = None
 
-    def update(self, delta_time):
-        """Updates the projectile's position and fluctuation animation."""
+    def has_live_target(self):
+        """True if the word this wave was sent at is still on screen and can be hit."""
+        target = self.target
+        return (target is not None and target.generation == self.target_generation
+                and target.typed and not target.hit_by_projectile)
+
+    def update(self, delta_time, bounds):
+        """Updates the projectile's position and fluctuation animation. bounds is the playfield rect."""
         # Update position
         self.x += self.dx * self.speed * delta_time # Scale speed by delta_time for frame-rate independence
         self.y += self.dy * self.speed * delta_time
@@ -163,12 +1330,9 @@ class SoundWaveProjectile:
         self.current_radius = self.base_radius + self.fluctuation_magnitude * math.sin(self.animation_timer)
         self.current_radius = max(self.thickness, int(self.current_radius)) # Ensure radius is at least thickness
         
-        # Update rect for movement and collision detection
-        # Re-create rect with new fluctuating size, keeping center
-        old_center = self.rect.center
+        # Update rect for movement and collision detection: fluctuating size, centered at the current position
         self.rect.width = self.rect.height = self.current_radius * 2
-        self.rect.center = old_center # Keep it centered while resizing
-        self.rect.center = (int(self.x), int(self.y)) # Then move it to current position
+        self.rect.center = (int(self.x), int(self.y))
 
         # Mark as done if it goes off screen or significantly past the target
         
@@ -182,71 +1346,108 @@ class SoundWaveProjectile:
                            self.dy == 0
         
         # If both x and y target are reached, or it's completely off screen, mark as done
-        if (target_reached_x and target_reached_y) or not pygame.display.get_surface().get_rect().colliderect(self.rect):
+        if (target_reached_x and target_reached_y) or not bounds.colliderect(self.rect):
             self.done = True
 
 
     def draw(self, surface):
-        """Draws the hollow fluctuating circle."""
+        """Draws the hollow fluctuating circle. Returns the drawn area (None if nothing was drawn)."""
         if self.done or self.current_radius <= 0:
-            return
+            return None
 
-        # Draw the circle directly on the main surface
-        draw_color = self.color 
-        
-        try:
-            # Draw on the surface using integer coordinates
-            pygame.draw.circle(surface, draw_color, 
-                               (int(self.x), int(self.y)), 
-                               int(self.current_radius), 
-                               self.thickness)
-        except ValueError as e:
-            # Handle cases where radius or color might temporarily be invalid
-            pass # Just skip drawing this frame if invalid
+        # One blit of the pre-rendered ring of this radius
+        radius = int(self.current_radius)
+        ring = self.rings[radius - self.min_radius]
+        return surface.blit(ring, (int(self.x) - radius, int(self.y) - radius))
+
+PROJECTILE_POOL = EntityPool(SoundWaveProjectile)
 
 class Word:
-    """Represents a word falling from the top, attached to a Bulalakaw."""
-    def __init__(self, text, speed, xpos, ypos, fonts, bulalakaw_asset_paths):
+    """Represents a word falling from the top, attached to a Bulalakaw. Pooled through WORD_POOL."""
+    __slots__ = ('text', 'speed', 'y', 'typed', 'hit_by_projectile', 'boom_animation_finished', 'fonts',
+                 'display_text', 'normalized_text', 'bulalakaw', 'rect', 'text_offset_x', 'text_offset_y',
+                 'match_len', 'text_surfaces', 'generation', 'store', 'store_index')
+
+    def __init__(self, text, speed, xpos, ypos, fonts, bulalakaw_asset_paths, normalized_text=None, text_width=None):
+        self.rect = pygame.Rect(0, 0, 0, 0) # Kept for the life of the object, follows the bulalakaw
+        self.generation = 0
+        self.store = None # EntityStore that owns the movement state, if the numpy backend is used
+        self.store_index = -1
+        self.reset(text, speed, xpos, ypos, fonts, bulalakaw_asset_paths, normalized_text, text_width)
+
+    def reset(self, text, speed, xpos, ypos, fonts, bulalakaw_asset_paths, normalized_text=None, text_width=None):
+        """(Re)initializes the word and takes a bulalakaw from the pool."""
         self.text = text
-        self.speed = speed
+        self.speed = speed # Pixels per 1/FPS seconds
+        self.y = float(ypos) # Exact position, the rect is rounded from it
         self.typed = False # True when the word is successfully typed
         self.hit_by_projectile = False # True when hit by a projectile
         self.boom_animation_finished = False # Flag to track if the boom animation is done
         self.fonts = fonts
 
-        self.bulalakaw = Bulalakaw(xpos, ypos, bulalakaw_asset_paths)
-        self.rect = self.bulalakaw.rect.copy() # Word's rect follows bulalakaw's rect
-
-        # Calculate text position relative to bulalakaw image
-        text_surface = self.fonts['word'].render(self.text.upper(), True, pygame.Color('white'))
-        self.text_offset_x = (self.rect.width - text_surface.get_width()) // 2
-        self.text_offset_y = (self.rect.height - text_surface.get_height()) // 2 + 20
-
-    def draw(self, surface, active_string):
-        """Draws the bulalakaw and the word text."""
-        surface.blit(self.bulalakaw.image, self.bulalakaw.rect)
+        # Precomputed once (or taken from the WordIndex): the text as displayed and as matched against the (accent-free) input
+        self.display_text = self.text.upper()
+        self.normalized_text = normalized_text if normalized_text is not None else remove_accents(self.text.lower())
+
+        self.bulalakaw = BULALAKAW_POOL.acquire(xpos, ypos, bulalakaw_asset_paths)
+        self.rect.update(self.bulalakaw.rect) # Word's rect follows bulalakaw's rect
+
+        # Calculate text position relative to bulalakaw image (measured, the text is rendered on first draw)
+        if text_width is None:
+            text_width = self.fonts['word'].size(self.display_text)[0]
+        self.text_offset_x = (self.rect.width - text_width) // 2
+        self.text_offset_y = (self.rect.height - self.fonts['word'].get_height()) // 2 + 20
+
+        # Pre-rendered (green prefix, white rest) surfaces, rebuilt only when the matched length changes
+        self.match_len = 0
+        self.text_surfaces = None
+
+    def release(self):
+        """Returns the bulalakaw to its pool and drops the rendered text."""
+        self.generation += 1 # Tells projectiles (and a pending launch) aimed at this word that it is gone
+        BULALAKAW_POOL.release(self.bulalakaw)
+        self.bulalakaw = None
+        self.text_surfaces = None
+
+    def set_match_len(self, match_len):
+        """Updates how many leading letters are highlighted, re-rendering only on change."""
+        if match_len == self.match_len:
+            return
+        self.match_len = match_len
+        self.text_surfaces = None # Rendered again on the next draw
 
-        # Highlight typed prefix
-        normalized_word = remove_accents(self.text.lower())
-        normalized_input = remove_accents(active_string.lower())
+    def render_text(self):
+        """Renders the highlighted prefix and the rest of the text."""
+        match_len = self.match_len
+        font = self.fonts['word']
+        prefix_surface = TEXT_CACHE.render(font, self.display_text[:match_len], pygame.Color('green')) if match_len else None
+        rest_surface = TEXT_CACHE.render(font, self.display_text[match_len:], pygame.Color('white')) if match_len < len(self.display_text) else None
+        self.text_surfaces = (prefix_surface, rest_surface)
 
-        match_prefix = normalized_word.startswith(normalized_input) if normalized_input else False
+    def draw(self, surface):
+        """Draws the bulalakaw and the word text (typed prefix highlighted via set_match_len). Returns the drawn area."""
+        drawn = surface.blit(self.bulalakaw.image, self.bulalakaw.rect)
 
         x = self.bulalakaw.rect.x + self.text_offset_x
         y = self.bulalakaw.rect.y + self.text_offset_y
 
-        for i, char in enumerate(self.text.upper()):
-            color = pygame.Color('green') if match_prefix and i < len(active_string) else pygame.Color('white')
-            char_surface = self.fonts['word'].render(char, True, color)
-            surface.blit(char_surface, (x, y))
-            x += char_surface.get_width()
+        if self.text_surfaces is None:
+            self.render_text()
+        prefix_surface, rest_surface = self.text_surfaces
+        if prefix_surface:
+            drawn.union_ip(surface.blit(prefix_surface, (x, y)))
+            x += prefix_surface.get_width()
+        if rest_surface:
+            drawn.union_ip(surface.blit(rest_surface, (x, y)))
+        return drawn
 
     def update(self, delta_time):
         """Updates the word's state and position. Returns True if word is ready for removal."""
         # A word only moves if it hasn't started booming
         if not self.bulalakaw.booming:
-            self.bulalakaw.rect.y += self.speed
-            self.rect = self.bulalakaw.rect.copy() # Keep word's rect synced
+            self.y += self.speed * FPS * delta_time # Scaled by delta_time so the fall speed does not depend on frame rate
+            self.bulalakaw.rect.y = int(self.y)
+            self.rect.update(self.bulalakaw.rect) # Keep word's rect synced
 
         # Update Bulalakaw animation. The Bulalakaw's update returns True when its *boom* animation is finished.
         if self.bulalakaw.update(delta_time):
@@ -266,6 +1467,8 @@ class Word:
         """Marks the word as typed. It continues its downward movement."""
         self.typed = True
         # Meteor will continue to fall, but is now "targetable" by projectile.
+        if self.store is not None:
+            self.store.word_typed[self.store_index] = True
 
     def trigger_boom_from_hit(self):
         """Triggers the boom animation for the bulalakaw."""
@@ -273,11 +1476,493 @@ class Word:
         if not self.hit_by_projectile:
             self.hit_by_projectile = True
             self.bulalakaw.boom()
+            if self.store is not None:
+                self.store.boom(self.store_index)
 
     def get_bottom(self):
         """Returns the bottom y-coordinate of the bulalakaw."""
         return self.bulalakaw.rect.bottom
 
+WORD_POOL = EntityPool(Word)
+
+class EntityStore:
+    """
+    Struct-of-arrays state of every word and projectile for the 'numpy' entity backend.
+    Positions, speeds, animation timers, sprite indices and projectile radii live in NumPy arrays
+    and are advanced for all entities at once, including the off-screen, target-reached and
+    rect overlap tests. Word, Bulalakaw and SoundWaveProjectile objects stay the views the rest of
+    the game uses: after each update, sync_words()/sync_projectiles() copy back what drawing and the game rules read.
+    """
+    WORD_FIELDS = {
+        'word_alive': bool, 'word_y': float, 'word_speed': float, 'word_x': int, 'word_w': int, 'word_h': int,
+        'word_timer': float, 'word_anim_speed': float, 'word_sprite': int, 'word_shown': int,
+        'word_booming': bool, 'word_typed': bool, 'word_hit': bool, 'word_finished': bool, 'word_serial': int,
+    }
+    PROJECTILE_FIELDS = {
+        'proj_alive': bool, 'proj_x': float, 'proj_y': float, 'proj_dx': float, 'proj_dy': float, 'proj_speed': float,
+        'proj_target_x': float, 'proj_target_y': float, 'proj_timer': float, 'proj_anim_speed': float,
+        'proj_magnitude': float, 'proj_base_radius': float, 'proj_thickness': int, 'proj_radius': int,
+        'proj_done': bool, 'proj_target': int, 'proj_target_serial': int,
+    }
+
+    def __init__(self, capacity=64):
+        self.words = [] # Row -> Word (None for free rows)
+        self.projectiles = []
+        self.free_word_rows = []
+        self.free_projectile_rows = []
+        self.next_serial = 0 # Identifies a word across row reuse, for projectile targets
+        for name, dtype in self.WORD_FIELDS.items():
+            setattr(self, name, numpy.zeros(0, dtype=dtype))
+        for name, dtype in self.PROJECTILE_FIELDS.items():
+            setattr(self, name, numpy.zeros(0, dtype=dtype))
+        self.grow_words(capacity)
+        self.grow_projectiles(capacity)
+
+    def grow_words(self, capacity):
+        """Resizes the word arrays (never shrinks)."""
+        old = len(self.words)
+        for name in self.WORD_FIELDS:
+            array = getattr(self, name)
+            grown = numpy.zeros(capacity, dtype=array.dtype)
+            grown[:old] = array
+            setattr(self, name, grown)
+        self.words.extend([None] * (capacity - old))
+        self.free_word_rows.extend(range(capacity - 1, old - 1, -1))
+
+    def grow_projectiles(self, capacity):
+        """Resizes the projectile arrays (never shrinks)."""
+        old = len(self.projectiles)
+        for name in self.PROJECTILE_FIELDS:
+            array = getattr(self, name)
+            grown = numpy.zeros(capacity, dtype=array.dtype)
+            grown[:old] = array
+            setattr(self, name, grown)
+        self.projectiles.extend([None] * (capacity - old))
+        self.free_projectile_rows.extend(range(capacity - 1, old - 1, -1))
+
+    def add_word(self, word):
+        """Copies a new word's state into a free row and makes the word a view of it."""
+        if not self.free_word_rows:
+            self.grow_words(len(self.words) * 2)
+        row = self.free_word_rows.pop()
+        bulalakaw = word.bulalakaw
+        self.words[row] = word
+        self.word_alive[row] = True
+        self.word_y[row] = word.y
+        self.word_speed[row] = word.speed
+        self.word_x[row], _, self.word_w[row], self.word_h[row] = bulalakaw.rect
+        self.word_timer[row] = bulalakaw.animation_timer
+        self.word_anim_speed[row] = bulalakaw.animation_speed
+        self.word_sprite[row] = self.word_shown[row] = bulalakaw.current_sprite
+        self.word_booming[row] = bulalakaw.booming
+        self.word_typed[row] = word.typed
+        self.word_hit[row] = word.hit_by_projectile
+        self.word_finished[row] = word.boom_animation_finished
+        self.word_serial[row] = self.next_serial
+        self.next_serial += 1
+        word.store = self
+        word.store_index = row
+
+    def remove_word(self, word):
+        """Frees the word's row."""
+        row = word.store_index
+        self.word_alive[row] = False
+        self.words[row] = None
+        self.free_word_rows.append(row)
+        word.store = None
+        word.store_index = -1
+
+    def boom(self, row):
+        """Mirrors Bulalakaw.boom(): the frame shown only changes on the next update."""
+        self.word_hit[row] = True
+        self.word_booming[row] = True
+        self.word_sprite[row] = 6
+        self.word_timer[row] = 0.0
+
+    def add_projectile(self, proj):
+        """Copies a new projectile's state into a free row."""
+        if not self.free_projectile_rows:
+            self.grow_projectiles(len(self.projectiles) * 2)
+        row = self.free_projectile_rows.pop()
+        self.projectiles[row] = proj
+        self.proj_alive[row] = True
+        self.proj_x[row], self.proj_y[row] = proj.x, proj.y
+        self.proj_dx[row], self.proj_dy[row] = proj.dx, proj.dy
+        self.proj_speed[row] = proj.speed
+        self.proj_target_x[row], self.proj_target_y[row] = proj.target_x, proj.target_y
+        self.proj_timer[row] = proj.animation_timer
+        self.proj_anim_speed[row] = proj.animation_speed
+        self.proj_magnitude[row] = proj.fluctuation_magnitude
+        self.proj_base_radius[row] = proj.base_radius
+        self.proj_thickness[row] = proj.thickness
+        self.proj_radius[row] = proj.current_radius
+        self.proj_done[row] = proj.done
+        target = proj.target
+        if proj.has_live_target() and target.store is self:
+            self.proj_target[row] = target.store_index
+            self.proj_target_serial[row] = self.word_serial[target.store_index]
+        else:
+            self.proj_target[row] = -1
+        proj.store_index = row
+
+    def remove_projectile(self, proj):
+        """Frees the projectile's row."""
+        row = proj.store_index
+        self.proj_alive[row] = False
+        self.projectiles[row] = None
+        self.free_projectile_rows.append(row)
+        proj.store_index = -1
+
+    def update_words(self, delta_time):
+        """
+        Moves and animates every word (same rules as Word.update and Bulalakaw.update).
+        Returns a boolean array of the rows that are ready for removal.
+        """
+        alive = self.word_alive
+        booming = self.word_booming
+        falling = alive & ~booming
+
+        self.word_y[falling] += self.word_speed[falling] * FPS * delta_time
+        self.word_timer[alive] += self.word_anim_speed[alive] * delta_time
+
+        # Falling frames loop over 0-5, boom frames run once over 6-11
+        timer = self.word_timer
+        wrapped = falling & (timer >= 6)
+        timer[wrapped] = 0.0
+        self.word_sprite[falling] = timer[falling].astype(int) % 6
+        exploding = alive & booming
+        boom_frame = 6 + timer.astype(int)
+        boom_done = exploding & (boom_frame >= 12)
+        boom_running = exploding & ~boom_done
+        self.word_sprite[boom_done] = 11
+        self.word_sprite[boom_running] = boom_frame[boom_running]
+        self.word_finished |= boom_done
+
+        # The frame drawn is the one set by the update (a finished boom keeps its last shown frame)
+        shown = falling | boom_running
+        self.word_shown[shown] = self.word_sprite[shown]
+
+        bottom = self.word_y.astype(int) + self.word_h
+        return alive & ((self.word_hit & self.word_finished) | (~self.word_typed & (bottom > HEIGHT)))
+
+    def update_projectiles(self, delta_time, bounds, projectiles):
+        """
+        Moves and animates every projectile (same rules as SoundWaveProjectile.update), marks the
+        ones that reached their target or left bounds, then resolves hits against the typed words.
+        projectiles is the simulation's list: hits are resolved in its reverse order, as
+        GameSimulation.update_projectiles does, so two waves reaching one meteor together behave the same.
+        Returns a boolean array of the rows that are done.
+        """
+        alive = self.proj_alive
+        self.proj_x[alive] += (self.proj_dx * self.proj_speed * delta_time)[alive]
+        self.proj_y[alive] += (self.proj_dy * self.proj_speed * delta_time)[alive]
+        self.proj_timer[alive] += (self.proj_anim_speed * delta_time)[alive]
+
+        radius = (self.proj_base_radius + self.proj_magnitude * numpy.sin(self.proj_timer)).astype(int)
+        radius = numpy.maximum(self.proj_thickness, radius)
+        self.proj_radius[alive] = radius[alive]
+
+        x, y, dx, dy = self.proj_x, self.proj_y, self.proj_dx, self.proj_dy
+        reached_x = ((dx > 0) & (x >= self.proj_target_x)) | ((dx < 0) & (x <= self.proj_target_x)) | (dx == 0)
+        reached_y = ((dy > 0) & (y >= self.proj_target_y)) | ((dy < 0) & (y <= self.proj_target_y)) | (dy == 0)
+
+        # Rects as pygame builds them: centered on the truncated position, 2 * radius wide
+        left = x.astype(int) - radius
+        top = y.astype(int) - radius
+        size = radius * 2
+        on_screen = ((left < bounds.right) & (left + size > bounds.left) &
+                     (top < bounds.bottom) & (top + size > bounds.top))
+        self.proj_done |= alive & ((reached_x & reached_y) | ~on_screen)
+
+        flying = numpy.flatnonzero(alive & ~self.proj_done)
+        hittable = numpy.flatnonzero(self.word_alive & self.word_typed & ~self.word_hit)
+        if len(flying) and len(hittable):
+            self.resolve_hits(flying, hittable, left, top, size, projectiles)
+        return alive & self.proj_done
+
+    def resolve_hits(self, flying, hittable, left, top, size, projectiles):
+        """AABB-tests the flying projectiles against the hittable words, then applies the hits in order."""
+        word_left = self.word_x[hittable]
+        word_top = self.word_y[hittable].astype(int)
+        word_right = word_left + self.word_w[hittable]
+        word_bottom = word_top + self.word_h[hittable]
+        p_left, p_top, p_size = left[flying, None], top[flying, None], size[flying, None]
+        overlap = ((p_left < word_right) & (p_left + p_size > word_left) &
+                   (p_top < word_bottom) & (p_top + p_size > word_top))
+
+        # A wave whose target is still alive only tests that target
+        target = self.proj_target[flying]
+        live_target = (target >= 0) & self.word_alive[target] & (self.word_serial[target] == self.proj_target_serial[flying])
+        live_target &= self.word_typed[target] & ~self.word_hit[target]
+        overlap[live_target] &= hittable[None, :] == target[live_target, None]
+
+        candidates = numpy.flatnonzero(overlap.any(axis=1))
+        if not len(candidates):
+            return
+        # Rare: resolve in the simulation's order (end of its list first), skipping words already hit
+        position = {proj.store_index: index for index, proj in enumerate(projectiles)}
+        for i in sorted(candidates.tolist(), key=lambda i: -position[flying[i]]):
+            for j in numpy.flatnonzero(overlap[i]):
+                row = hittable[j]
+                if not self.word_hit[row]:
+                    self.words[row].trigger_boom_from_hit()
+                    self.proj_done[flying[i]] = True
+                    break
+
+    def sync_words(self, word_objects):
+        """Copies the array state back into the word objects."""
+        ys = self.word_y.tolist()
+        shown = self.word_shown.tolist()
+        sprite = self.word_sprite.tolist()
+        finished = self.word_finished.tolist()
+        for word in word_objects:
+            row = word.store_index
+            bulalakaw = word.bulalakaw
+            word.y = ys[row]
+            bulalakaw.rect.y = word.rect.y = int(ys[row])
+            bulalakaw.current_sprite = sprite[row]
+            bulalakaw.image = bulalakaw.sprites[shown[row]]
+            word.boom_animation_finished = finished[row]
+
+    def sync_projectiles(self, projectiles):
+        """Copies the array state back into the projectile objects."""
+        xs = self.proj_x.tolist()
+        ys = self.proj_y.tolist()
+        radii = self.proj_radius.tolist()
+        done = self.proj_done.tolist()
+        for proj in projectiles:
+            row = proj.store_index
+            proj.x, proj.y = xs[row], ys[row]
+            proj.current_radius = radii[row]
+            proj.rect.size = (radii[row] * 2, radii[row] * 2)
+            proj.rect.center = (int(xs[row]), int(ys[row]))
+            proj.done = done[row]
+
+def pool_stats():
+    """Returns the counters of every entity pool by name."""
+    return {
+        'words': WORD_POOL.stats(),
+        'bulalakaw': BULALAKAW_POOL.stats(),
+        'projectiles': PROJECTILE_POOL.stats(),
+    }
+
+class DirtyRectRenderer:
+    """
+    Tracks the screen regions drawn each frame. Next frame those regions are restored from a
+    cached background layer and only the touched rects are pushed with display.update.
+    With dirty=False every frame is a full redraw and flip, for comparison.
+    """
+    def __init__(self, screen, background, dirty=True):
+        self.screen = screen
+        self.background = background # Background image with the static UI chrome baked in
+        self.dirty = dirty
+        self.uses_background = dirty # Frames are drawn over the background layer (the full mode redraws everything)
+        self.previous_rects = [] # Drawn last frame, restored at the start of this one
+        self.current_rects = [] # Drawn this frame
+        self.full_redraw = True # Next frame must redraw everything (first frame, overlays)
+        self.full_this_frame = True
+
+    def invalidate(self):
+        """Forces a full flip of this frame and a full redraw of the next (e.g. after a full-screen overlay)."""
+        self.full_redraw = True
+
+    def begin_frame(self):
+        """Restores last frame's dirty regions (or the whole screen) from the background layer."""
+        self.full_this_frame = self.full_redraw or not self.dirty
+        self.full_redraw = False
+        if not self.dirty:
+            pass # The caller redraws the whole frame itself
+        elif self.full_this_frame:
+            self.screen.blit(self.background, (0, 0))
+        else:
+            for rect in self.previous_rects:
+                self.screen.blit(self.background, rect, rect)
+        self.current_rects = []
+
+    def mark(self, rect):
+        """Records a region drawn this frame. Returns the rect for convenience."""
+        if rect:
+            self.current_rects.append(rect)
+        return rect
+
+    def present(self):
+        """Pushes this frame to the display."""
+        rects = None if self.full_this_frame or self.full_redraw else self.previous_rects + self.current_rects
+        if isinstance(self.screen, ScaledScreen):
+            rects = self.screen.stretch(rects) # The internal framebuffer is enlarged onto the window first
+        if rects is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(rects)
+        self.previous_rects = self.current_rects
+
+class ScaledScreen:
+    """
+    Stands in for the display surface when rendering below full resolution. The game keeps drawing in
+    logical WIDTH x HEIGHT coordinates: blits land scaled (with SURFACE_SCALER's variants) in a smaller
+    framebuffer, and stretch() enlarges it onto the window. The window keeps its size, so mouse positions
+    and Button hit-testing stay logical. Returned rects are logical too, covering every pixel drawn.
+    """
+    def __init__(self, display, factor):
+        self.display = display
+        self.rect = display.get_rect()
+        self.set_factor(factor)
+
+    def set_factor(self, factor):
+        """Switches to another render scale. At 1.0 the framebuffer is the display surface itself."""
+        SURFACE_SCALER.set_factor(factor)
+        self.factor = factor
+        # Blocks of `logical` window pixels are enlarged from exactly `pixels` framebuffer pixels (e.g. 4 from 3 at 0.75)
+        ratio = fractions.Fraction(factor).limit_denominator(64)
+        self.block = (ratio.denominator, ratio.numerator) # (logical, pixels)
+        if factor == 1.0:
+            self.surface = self.display
+        else:
+            self.surface = pygame.Surface(SURFACE_SCALER.scaled_size(self.rect.size, factor)).convert()
+
+    def to_pixels(self, rect):
+        """Returns the framebuffer rect covering the logical rect."""
+        factor = self.factor
+        left, top = math.floor(rect.left * factor), math.floor(rect.top * factor)
+        return pygame.Rect(left, top, math.ceil(rect.right * factor) - left, math.ceil(rect.bottom * factor) - top)
+
+    def to_logical(self, rect):
+        """Returns the logical rect covering the framebuffer rect."""
+        factor = self.factor
+        left, top = math.floor(rect.left / factor), math.floor(rect.top / factor)
+        return pygame.Rect(left, top, math.ceil(rect.right / factor) - left, math.ceil(rect.bottom / factor) - top)
+
+    def blit(self, source, dest, area=None):
+        """Draws source (or its area) at the logical position dest, like Surface.blit. Returns the logical rect drawn."""
+        factor = self.factor
+        position = (math.floor(dest[0] * factor), math.floor(dest[1] * factor))
+        if area is not None:
+            area = self.to_pixels(pygame.Rect(area))
+        return self.to_logical(self.surface.blit(SURFACE_SCALER.scaled(source), position, area))
+
+    def fill(self, color):
+        """Clears the whole frame to color."""
+        self.surface.fill(color)
+
+    def stretch(self, rects=None):
+        """
+        Enlarges the framebuffer onto the display: only the logical rects given, or all of it if None.
+        Returns the display rects that changed (None for all of it).
+        """
+        if self.surface is self.display:
+            return rects
+        if rects is None:
+            pygame.transform.scale(self.surface, self.rect.size, self.display)
+            return None
+        logical, pixels = self.block
+        bounds = self.surface.get_rect()
+        stretched = []
+        for rect in rects:
+            rect = pygame.Rect(rect).clip(self.rect)
+            if not rect:
+                continue
+            # Widened to whole blocks, so every pixel is enlarged exactly as a full stretch would
+            left, top = rect.left // logical, rect.top // logical
+            right, bottom = -(-rect.right // logical), -(-rect.bottom // logical)
+            dest = pygame.Rect(left * logical, top * logical, (right - left) * logical, (bottom - top) * logical).clip(self.rect)
+            source = pygame.Rect(left * pixels, top * pixels, (right - left) * pixels, (bottom - top) * pixels).clip(bounds)
+            pygame.transform.scale(self.surface.subsurface(source), dest.size, self.display.subsurface(dest))
+            stretched.append(dest)
+        return stretched
+
+    def get_rect(self):
+        return self.rect.copy()
+
+    def get_size(self):
+        return self.rect.size
+
+    def get_width(self):
+        return self.rect.width
+
+    def get_height(self):
+        return self.rect.height
+
+class TextureScreen:
+    """
+    Stands in for the display surface with the 'texture' backend. Only the Surface calls the game draws
+    the screen with are supported: blit, fill and the size getters. Each blitted surface is uploaded once
+    and its texture kept for as long as the surface lives, so a surface must not change after it is drawn.
+    """
+    def __init__(self, size, title):
+        self.window = sdl2_video.Window(title, size)
+        try:
+            self.renderer = sdl2_video.Renderer(self.window, accelerated=1)
+        except sdl2_video.error as e:
+            print(f"Warning: No accelerated renderer ({e}), using SDL's software renderer")
+            self.renderer = sdl2_video.Renderer(self.window, accelerated=0)
+        self.rect = pygame.Rect((0, 0), size)
+        self.textures = weakref.WeakKeyDictionary() # Surface -> Texture
+        self.uploads = 0
+
+    def texture(self, surface):
+        """Returns the texture of surface, uploading it the first time. Surfaces with alpha blend, opaque ones don't."""
+        texture = self.textures.get(surface)
+        if texture is None:
+            texture = sdl2_video.Texture.from_surface(self.renderer, surface)
+            self.textures[surface] = texture
+            self.uploads += 1
+        return texture
+
+    def blit(self, source, dest, area=None):
+        """Draws source (or its area) at dest, like Surface.blit. Returns the drawn rect, clipped to the screen."""
+        if area is None:
+            width, height = source.get_size()
+        else:
+            area = pygame.Rect(area)
+            width, height = area.size
+        drawn = pygame.Rect(dest[0], dest[1], width, height)
+        if width and height: # Textures can't be empty (e.g. the typed text before the first key)
+            self.texture(source).draw(srcrect=area, dstrect=drawn)
+        return drawn.clip(self.rect)
+
+    def fill(self, color):
+        """Clears the whole frame to color."""
+        self.renderer.draw_color = color
+        self.renderer.clear()
+
+    def get_rect(self):
+        return self.rect.copy()
+
+    def get_size(self):
+        return self.rect.size
+
+    def get_width(self):
+        return self.rect.width
+
+    def get_height(self):
+        return self.rect.height
+
+class TextureRenderer:
+    """
+    The DirtyRectRenderer interface for a TextureScreen. Textures are cheap to redraw, so every frame
+    starts from the whole background layer and presents the whole frame.
+    """
+    def __init__(self, screen, background):
+        self.screen = screen
+        self.background = background # Background image with the static UI chrome baked in
+        self.uses_background = True
+
+    def invalidate(self):
+        """Every frame is a full redraw already."""
+        pass
+
+    def begin_frame(self):
+        """Starts the frame from the background layer."""
+        self.screen.blit(self.background, (0, 0))
+
+    def mark(self, rect):
+        """Nothing to track, returns rect for convenience."""
+        return rect
+
+    def present(self):
+        """Shows this frame in the window."""
+        self.screen.renderer.present()
+
 class Button:
     """A generic button class for clickable elements."""
     def __init__(self, xpos, ypos, text, font, surface):
@@ -288,45 +1973,194 @@ class Button:
         self.font = font
         self.surface = surface
         self.rect = None
+        self.faces = {} # State -> circular button pre-rendered on its own surface
+
+    def circle_face(self, state):
+        """Returns the circular button rendered in state on a transparent surface, to blit at circle_rect()."""
+        face = self.faces.get(state)
+        if face is None:
+            face = pygame.Surface((71, 71), pygame.SRCALPHA)
+            Button(35, 35, self.text, self.font, face).render_circle(state)
+            self.faces[state] = face
+        return face
+
+    def get_state(self, rect, mouse_pos, mouse_clicked):
+        """Returns 'pressed', 'hover' or 'idle' depending on the mouse over rect."""
+        if rect.collidepoint(mouse_pos):
+            return 'pressed' if mouse_clicked else 'hover'
+        return 'idle'
+
+    def circle_rect(self):
+        """Returns the area covered by the circular button."""
+        return pygame.Rect(self.xpos - 35, self.ypos - 35, 70, 70)
+
+    def rect_rect(self):
+        """Returns the area covered by the rectangular button."""
+        return pygame.Rect(self.xpos, self.ypos, 400, 70)
 
     def draw_circle_button(self, mouse_pos, mouse_clicked):
         """Draws a circular button."""
-        self.clicked = False # Reset clicked state for the current frame
+        state = self.get_state(self.circle_rect(), mouse_pos, mouse_clicked)
+        self.render_circle(state)
+        self.clicked = state == 'pressed'
+        return self.clicked
+
+    def render_circle(self, state):
+        """Draws the circular button in the given state ('idle', 'hover' or 'pressed')."""
         circle = pygame.draw.circle(self.surface, (45, 89, 135), (self.xpos, self.ypos), 35)
-        if circle.collidepoint(mouse_pos):
-            if mouse_clicked:
-                pygame.draw.circle(self.surface, (190, 35, 35), (self.xpos, self.ypos), 35)
-                self.clicked = True
-            else:
-                pygame.draw.circle(self.surface, (190, 89, 135), (self.xpos, self.ypos), 35)
+        if state == 'pressed':
+            pygame.draw.circle(self.surface, (190, 35, 35), (self.xpos, self.ypos), 35)
+        elif state == 'hover':
+            pygame.draw.circle(self.surface, (190, 89, 135), (self.xpos, self.ypos), 35)
         pygame.draw.circle(self.surface, pygame.Color('white'), (self.xpos, self.ypos), 35, 3)
-        text_surface = self.font.render(self.text, True, pygame.Color('white'))
+        text_surface = TEXT_CACHE.render(self.font, self.text, pygame.Color('white'))
         self.surface.blit(text_surface, (self.xpos - text_surface.get_width() // 2, self.ypos - text_surface.get_height() // 2))
         self.rect = circle
-        return self.clicked
 
     def draw_rect_button(self, mouse_pos, mouse_clicked):
         """Draws a rectangular button."""
-        self.clicked = False # Reset clicked state for the current frame
-        rect = pygame.Rect(self.xpos, self.ypos, 400, 70)
+        state = self.get_state(self.rect_rect(), mouse_pos, mouse_clicked)
+        self.render_rect(state)
+        self.clicked = state == 'pressed'
+        return self.clicked
+
+    def render_rect(self, state):
+        """Draws the rectangular button in the given state ('idle', 'hover' or 'pressed')."""
+        rect = self.rect_rect()
         pygame.draw.rect(self.surface, PALETTE["soft_yellow"], rect, border_radius=6)
-        if rect.collidepoint(mouse_pos):
-            if mouse_clicked:
-                pygame.draw.rect(self.surface, (190, 35, 35), rect, border_radius=3)
-                self.clicked = True
-            else:
-                pygame.draw.rect(self.surface, (190, 89, 135), rect, border_radius=3)
+        if state == 'pressed':
+            pygame.draw.rect(self.surface, (190, 35, 35), rect, border_radius=3)
+        elif state == 'hover':
+            pygame.draw.rect(self.surface, (190, 89, 135), rect, border_radius=3)
         pygame.draw.rect(self.surface, pygame.Color('white'), rect, 2, border_radius=6)
-        text_surface = self.font.render(self.text, True, pygame.Color('white'))
+        text_surface = TEXT_CACHE.render(self.font, self.text, pygame.Color('white'))
         text_pos = (self.xpos + (400 - text_surface.get_width()) // 2, self.ypos + (70 - text_surface.get_height()) // 2)
         self.surface.blit(text_surface, text_pos)
         self.rect = rect
-        return self.clicked
+
+class CachedOverlay:
+    """
+    A full-screen translucent overlay built in two cached layers: the static base (panel and labels),
+    rebuilt only when base_key changes, and the composed surface with the buttons on top,
+    redrawn only when the buttons' hover/selection state_key changes.
+    """
+    def __init__(self, size):
+        self.size = size
+        self.base = None
+        self.surface = None
+        self.base_key = None
+        self.state_key = None
+
+    def update(self, base_key, draw_base, state_key, draw_state):
+        """Brings the cached layers up to date and returns the composed surface."""
+        if self.base is None or base_key != self.base_key:
+            self.base = pygame.Surface(self.size, pygame.SRCALPHA)
+            draw_base(self.base)
+            self.base_key = base_key
+            self.surface = None
+        if self.surface is None or state_key != self.state_key:
+            self.surface = self.base.copy()
+            draw_state(self.surface, state_key)
+            self.state_key = state_key
+        return self.surface
+
+class HudText:
+    """
+    The HUD labels that change during play. Each field keeps the surface rendered for its last value
+    and is only re-rendered when that value changes, so most frames cost one blit per field.
+    Fixed labels don't belong here, they are baked into the background layer.
+    """
+    def __init__(self, fonts, fields):
+        self.fonts = fonts
+        self.fields = fields # Name -> (font name, position, format string)
+        self.values = {}
+        self.surfaces = {}
+        self.renders = 0
+
+    def draw(self, surface, values):
+        """Blits the fields in values (name -> value), re-rendering the changed ones. Returns the drawn rects."""
+        rects = []
+        for name, value in values.items():
+            font_name, position, text_format = self.fields[name]
+            if name not in self.surfaces or self.values[name] != value:
+                self.surfaces[name] = self.fonts[font_name].render(text_format.format(value), True, pygame.Color('white'))
+                self.values[name] = value
+                self.renders += 1
+            rects.append(surface.blit(self.surfaces[name], position))
+        return rects
+
+class ProfilerHud:
+    """
+    Toggleable overlay with the frame rate, per-phase timings, entity counts and cache stats.
+    Showing it turns the game's PhaseTimer on, hiding it turns it off again. The text is only
+    re-rendered a few times per second so the HUD itself barely shows up in the numbers.
+    """
+    REFRESH_FRAMES = 15
+    TEXT_COLOR = (230, 230, 230)
+    BACKGROUND = (0, 0, 0, 170)
+
+    def __init__(self, timer, position=(10, 10)):
+        self.timer = timer
+        self.position = position
+        self.visible = False
+        self.font = None # A monospace system font (pygame's default if there is none), opened when first shown
+        self.surface = None
+        self.frames_until_refresh = 0
+
+    def toggle(self):
+        """Shows or hides the HUD (and starts or stops timing)."""
+        self.visible = not self.visible
+        self.timer.enabled = self.visible
+        self.frames_until_refresh = 0
+
+    def lines(self, game):
+        """Returns the HUD text lines for the current state of game."""
+        frame = PhaseTimer.summarize([seconds * 1000.0 for seconds in self.timer.frame_times])
+        lines = [f"FPS {game.clock.get_fps():5.1f}   frame p50 {frame['p50']:5.2f}  p95 {frame['p95']:5.2f}  max {frame['max']:5.2f} ms  scale {game.render_scale:g}",
+                 f"{'phase':<18}{'mean':>7}{'p95':>7}{'max':>7}"]
+        for name, values in self.timer.samples().items():
+            summary = PhaseTimer.summarize(values)
+            lines.append(f"{name:<18}{summary['mean']:7.2f}{summary['p95']:7.2f}{summary['max']:7.2f}")
+        pools = pool_stats()
+        lines.append(f"words {len(game.word_objects)}  projectiles {len(game.projectiles)}  "
+                     f"pooled {pools['words']['free']}/{pools['projectiles']['free']} free")
+        sprites = SPRITE_CACHE.stats()
+        texts = TEXT_CACHE.stats()
+        lines.append(f"sprites {sprites['entries']} ({sprites['hits']} hits, {sprites['disk_loads']} disk, {sprites['pack_loads']} pack)")
+        lines.append(f"text {texts['entries']} ({texts['hits']} hits, {texts['misses']} misses)  hud renders {game.hud_text.renders}  rings {RING_CACHE.stats()['surfaces']}")
+        latency = game.latency.summarize()
+        lines.append("submit to  " + "  ".join(f"{stage} {latency[stage]['p50']:.0f}/{latency[stage]['p95']:.0f}"
+                                               for stage in ('read', 'check', 'launch', 'hit', 'shown')) + " ms p50/p95")
+        return lines
+
+    def render(self, game):
+        """Renders the HUD panel."""
+        if self.font is None:
+            self.font = pygame.font.SysFont('monospace', 15)
+        rendered = [self.font.render(line, True, self.TEXT_COLOR) for line in self.lines(game)]
+        line_height = self.font.get_linesize()
+        panel = pygame.Surface((max(text.get_width() for text in rendered) + 12, line_height * len(rendered) + 10), pygame.SRCALPHA)
+        panel.fill(self.BACKGROUND)
+        for i, text in enumerate(rendered):
+            panel.blit(text, (6, 5 + i * line_height))
+        return panel
+
+    def draw(self, surface, game):
+        """Draws the HUD if visible. Returns the drawn area (None if hidden)."""
+        if not self.visible:
+            return None
+        self.frames_until_refresh -= 1
+        if self.surface is None or self.frames_until_refresh <= 0:
+            self.surface = self.render(game)
+            self.frames_until_refresh = self.REFRESH_FRAMES
+        return surface.blit(self.surface, self.position)
 
 class Image:
     """Simple class to draw a scaled image."""
     def __init__(self, img, width, height, xpos, ypos):
         self.image = pygame.transform.scale(img, (width, height))
+        # Below full render scale, drawn from a variant scaled from img rather than from the scaled image
+        SURFACE_SCALER.register(self.image, lambda factor: pygame.transform.smoothscale(img, SURFACE_SCALER.scaled_size((width, height), factor)))
         self.xpos = xpos
         self.ypos = ypos
 
@@ -340,39 +2174,278 @@ class LivesIndicator:
     Images are ordered from full lives (index 0) to game over (last index).
     """
     def __init__(self, image_paths, xpos, ypos, width, height, max_lives=7):
-        self.images = []
-        for path in image_paths:
-            img = pygame.image.load(get_asset_path(path)).convert_alpha()
-            img = pygame.transform.scale(img, (width, height))
-            self.images.append(img)
+        # Each moon phase is loaded the first time that many lives are left
+        self.images = [LazyAsset(path, lambda path=path: SPRITE_CACHE.load(path, (width, height))) for path in image_paths]
         self.xpos = xpos
         self.ypos = ypos
         self.max_lives = max_lives
 
     def draw(self, surface, lives_remaining):
-        """Draws the moon image corresponding to remaining lives."""
+        """Draws the moon image corresponding to remaining lives. Returns the drawn area."""
         index = self.max_lives - lives_remaining
         index = max(0, min(index, len(self.images) - 1))
-        surface.blit(self.images[index], (self.xpos, self.ypos))
+        return surface.blit(self.images[index].get(), (self.xpos, self.ypos))
+
+FONT_SPECS = {
+    'karatula': ('Bakunawa Assets/Fonts/LL KARATULA 020721.ttf', 30),
+    'karatula_65': ('Bakunawa Assets/Fonts/LL KARATULA 020721.ttf', 65),
+    'karatula_25': ('Bakunawa Assets/Fonts/LL KARATULA 020721.ttf', 25),
+    'karatula_45': ('Bakunawa Assets/Fonts/LL KARATULA 020721.ttf', 45),
+    'square': ('Bakunawa Assets/Fonts/Square.ttf', 50),
+    'kawit': ('Bakunawa Assets/Fonts/KawitFree-CndItalic.ttf', 85),
+    'martiresExtraBold': ('Bakunawa Assets/Fonts/BBTMartiresFree-ExtraBold.ttf', 55),
+    'pause': ('Bakunawa Assets/Fonts/1up.ttf', 38),
+    'word': (WORD_FONT_PATH, WORD_FONT_SIZE),
+}
 
-class Game:
-    """Main game class managing game state, assets, and loop."""
-    def __init__(self, madali_words, katamtaman_words, mahirap_words):
-        self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
-        pygame.display.set_caption("Bakunawa: Typing Game")
-        self.clock = pygame.time.Clock()
-        
-        self.game_over = False
+def load_fonts():
+    """Returns the game's fonts keyed by name. Each one is opened the first time it is used."""
+    return LazyFonts(FONT_SPECS)
+
+def write_varint(out, value):
+    """Appends a non-negative int to out (a bytearray) as a LEB128 varint."""
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return
+
+def read_varint(data, position):
+    """Reads a LEB128 varint from data at position. Returns (value, next position)."""
+    value = 0
+    shift = 0
+    while True:
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, position
+        shift += 7
+
+class Replay:
+    """
+    One recorded session: the RNG seed, the starting difficulty and every input action with the
+    simulation tick it was applied at and its wall-clock time. Since the simulation is deterministic
+    per tick, applying the same actions at the same ticks reproduces the session exactly.
+
+    File layout: MAGIC, then varints (seed, choices bitmask, end tick, level, score, lives),
+    the word index key (varint length + UTF-8), the starting language (varint WIKA index),
+    the event count, and per event the tick delta,
+    the milliseconds delta, the action code and its argument (UTF-8 text for 'type', the index for
+    'difficulty' and 'language', nothing otherwise). Bit LAUNCH_ON_KEYPRESS_BIT of the choices
+    bitmask records the launch_on_keypress option, which changes the gameplay.
+    """
+    MAGIC = b'BKRPLY02'
+    MAGIC_V1 = b'BKRPLY01' # Without the starting language, those sessions started in LANGUAGE
+    LAUNCH_ON_KEYPRESS_BIT = 1 << 7 # Above the difficulty bits, unset in replays made before the option existed
+    ACTIONS = ['type', 'backspace', 'submit', 'escape', 'difficulty', 'pause', 'resume', 'restart', 'language']
+
+    def __init__(self, seed, choices, index_key='', launch_on_keypress=False, language=LANGUAGE):
+        self.seed = seed
+        self.choices = list(choices)
+        self.index_key = index_key # Word index the session was played with, a different one gives different words
+        self.language = language # WIKA language the session started in
+        self.launch_on_keypress = launch_on_keypress
+        self.events = [] # (tick, milliseconds since start, action, arg)
+        self.end_tick = 0
+        self.result = (1, 0, LIVES_START) # (level, score, lives) when the recording was finished
+        self.started = time.perf_counter()
+
+    def record(self, tick, action, arg=''):
+        """Adds an action applied right before the given tick."""
+        self.events.append((tick, int((time.perf_counter() - self.started) * 1000), action, arg))
+
+    def finish(self, simulation):
+        """Stores where and how the session ended, for playback to run to and to check against."""
+        self.end_tick = simulation.tick
+        self.result = (simulation.level, simulation.score, simulation.lives)
+
+    def script(self):
+        """Returns the actions as (tick, action, arg), the format of GameSimulation.run()."""
+        return [(tick, action, arg) for tick, _, action, arg in self.events]
+
+    def to_bytes(self):
+        """Encodes the replay."""
+        out = bytearray(self.MAGIC)
+        choices_mask = sum(1 << i for i, chosen in enumerate(self.choices) if chosen)
+        if self.launch_on_keypress:
+            choices_mask |= self.LAUNCH_ON_KEYPRESS_BIT
+        for value in (self.seed, choices_mask, self.end_tick, *self.result):
+            write_varint(out, value)
+        key = self.index_key.encode('utf-8')
+        write_varint(out, len(key))
+        out += key
+        write_varint(out, WIKA.index(self.language))
+        write_varint(out, len(self.events))
+        last_tick = last_ms = 0
+        for tick, ms, action, arg in self.events:
+            write_varint(out, tick - last_tick)
+            write_varint(out, ms - last_ms)
+            out.append(self.ACTIONS.index(action))
+            if action == 'type':
+                text = arg.encode('utf-8')
+                write_varint(out, len(text))
+                out += text
+            elif action in ('difficulty', 'language'):
+                write_varint(out, int(arg))
+            last_tick, last_ms = tick, ms
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Decodes a replay written by to_bytes(). Raises ValueError if it isn't one."""
+        magic = data[:len(cls.MAGIC)]
+        if magic not in (cls.MAGIC, cls.MAGIC_V1):
+            raise ValueError("not a Bakunawa replay")
+        try:
+            position = len(cls.MAGIC)
+            values = []
+            for _ in range(6):
+                value, position = read_varint(data, position)
+                values.append(value)
+            seed, choices_mask, end_tick, level, score, lives = values
+            key_length, position = read_varint(data, position)
+            index_key = data[position:position + key_length].decode('utf-8')
+            position += key_length
+            language = LANGUAGE
+            if magic == cls.MAGIC:
+                language_index, position = read_varint(data, position)
+                language = WIKA[language_index]
+
+            replay = cls(seed, [bool(choices_mask & (1 << i)) for i in range(len(DIFFICULTY_NAMES))], index_key,
+                         bool(choices_mask & cls.LAUNCH_ON_KEYPRESS_BIT), language)
+            replay.end_tick = end_tick
+            replay.result = (level, score, lives)
+            count, position = read_varint(data, position)
+            tick = ms = 0
+            for _ in range(count):
+                tick_delta, position = read_varint(data, position)
+                ms_delta, position = read_varint(data, position)
+                tick += tick_delta
+                ms += ms_delta
+                action = cls.ACTIONS[data[position]]
+                position += 1
+                arg = ''
+                if action == 'type':
+                    length, position = read_varint(data, position)
+                    arg = data[position:position + length].decode('utf-8')
+                    position += length
+                elif action in ('difficulty', 'language'):
+                    arg, position = read_varint(data, position)
+                replay.events.append((tick, ms, action, arg))
+        except (IndexError, UnicodeDecodeError) as e:
+            raise ValueError(f"truncated or corrupt replay: {e}")
+        return replay
+
+    def save(self, path):
+        """Writes the replay to path, creating its folder if needed."""
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'wb') as replay_file:
+            replay_file.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        """Reads a replay file."""
+        with open(path, 'rb') as replay_file:
+            return cls.from_bytes(replay_file.read())
+
+class ReplayPlayer:
+    """
+    Applies a Replay's actions to a simulation at their recorded ticks.
+    run_fast() plays it to the end without rendering; advance() plays it in real time from a game loop,
+    waiting for the recorded time of actions taken while the game was not stepping (e.g. in the pause menu).
+    """
+    def __init__(self, replay, simulation):
+        self.replay = replay
+        self.simulation = simulation
+        self.index = 0 # Next event to apply
+        self.clock_ms = 0.0 # Playback time for real-time playback
+        self.accumulator = 0.0
+        simulation.replay = None # Playing back must not record
+        simulation.choices[:] = replay.choices
+        simulation.launch_on_keypress = replay.launch_on_keypress
+        simulation.last_choices_before_pause = list(replay.choices)
+        simulation.set_language(replay.language)
+        if replay.index_key and replay.index_key != simulation.word_index.key:
+            print("Warning: replay was recorded with a different word list or font, playback will diverge")
+
+    @property
+    def finished(self):
+        return self.index >= len(self.replay.events) and self.simulation.tick >= self.replay.end_tick
+
+    def next_tick(self):
+        """Tick of the next action, or the end tick when all were applied."""
+        if self.index < len(self.replay.events):
+            return self.replay.events[self.index][0]
+        return self.replay.end_tick
+
+    def apply_due(self, until_ms=None):
+        """Applies the actions due at the current tick (and, if until_ms is given, not recorded after it)."""
+        events = self.replay.events
+        simulation = self.simulation
+        while self.index < len(events) and events[self.index][0] <= simulation.tick:
+            tick, ms, action, arg = events[self.index]
+            if until_ms is not None and ms > until_ms:
+                return
+            simulation.apply_action(action, arg)
+            self.index += 1
+
+    def run_fast(self):
+        """Plays the whole replay as fast as possible. Returns the final (level, score, lives)."""
+        simulation = self.simulation
+        while not self.finished:
+            self.apply_due()
+            if simulation.paused or simulation.game_over:
+                break # Still in a menu after this tick's actions, so no later tick can be reached: the file ends here
+            simulation.step(FIXED_DT)
+        return (simulation.level, simulation.score, simulation.lives)
+
+    def advance(self, delta_time, speed=1.0):
+        """Plays delta_time seconds (times speed) of the replay: applies due actions and runs fixed steps."""
+        simulation = self.simulation
+        self.clock_ms += delta_time * 1000.0 * speed
+        self.accumulator = min(self.accumulator + delta_time * speed, FIXED_DT * MAX_STEPS_PER_FRAME)
+        self.apply_due(self.clock_ms)
+        while self.accumulator >= FIXED_DT and simulation.tick < self.next_tick():
+            simulation.step(FIXED_DT)
+            self.accumulator -= FIXED_DT
+            self.apply_due(self.clock_ms)
+        if simulation.tick >= self.next_tick():
+            self.accumulator = 0.0 # Waiting for an action's time, don't build up steps meanwhile
+
+class LevelPlan:
+    """The words of one level with their start positions and speeds, made ahead of time by GameSimulation.plan_level()."""
+    def __init__(self, level, difficulty, words_needed):
+        self.level = level
+        self.difficulty = difficulty
+        self.words_needed = words_needed
+        self.placements = [] # (text, normalized text, text width, x, y, speed)
+
+class GameSimulation:
+    """
+    The game rules without a window: words, projectiles, the actor, lives, score and levels.
+    step() always advances by a fixed timestep, so a seeded run with the same input is fully
+    deterministic and can be driven headless (SDL dummy driver) through run().
+    """
+    def __init__(self, language=LANGUAGE, fonts=None, seed=None, entity_backend=ENTITY_BACKEND, background_prefetch=False,
+                 launch_on_keypress=LAUNCH_ON_KEYPRESS):
+        if seed is None:
+            seed = random.randrange(1 << 32) # Still random, but known so the session can be replayed
+        self.rng = random.Random(seed) # All gameplay randomness goes through this, for reproducible runs
+        self.seed = seed
+        self.replay = None # Replay recording the input actions, if any
+        self.tick = 0 # Number of fixed steps simulated so far
+        self.bounds = pygame.Rect(0, 0, WIDTH, HEIGHT) # Playfield, projectiles leaving it are removed
+        self.timer = PhaseTimer() # Per-phase timings, enabled by benchmarks
+        self.fonts = fonts if fonts is not None else load_fonts()
 
-        self.madali_words = madali_words
-        self.katamtaman_words = katamtaman_words
-        self.mahirap_words = mahirap_words
+        self.game_over = False
 
-        self.assets = self.load_assets()
-        self.bg = Image(self.assets['bg_img'], WIDTH, HEIGHT, 0, 0)
-        self.fonts = self.assets['fonts']
-        # Load the gong sound effect
-        self.gong_sfx = self.assets['gong_sfx']
+        self.language = language
+        self.lexicon = LEXICONS[language] # Words are decoded from it only when drawn for a level
 
         self.lives = LIVES_START
         self.level = 1
@@ -382,198 +2455,242 @@ class Game:
         self.paused = False
         self.new_level = True # Flag to indicate if a new level needs to be generated
         self.word_objects = []
-        self.words_generated_this_level = 0
+        self.matcher = WordMatcher() # Prefix trie over word_objects, driven by the typed input
+        self.words_generated_this_level = 0 # All of the level's meteors, including the ones not spawned yet
         self.words_typed_this_level = 0
         self.words_missed_this_level = 0
+        self.spawn_queue = deque() # (tick since level start, placement) of the meteors still to come, in order
+        self.level_tick = 0
 
         # Actor animation state
         self.actor_current_frame = 0
         self.actor_animation_timer = 0.0
         self.actor_is_animating = False
         self.actor_animation_speed = 10.0
-        self.actor_animation_duration_frames = len(self.abatang_frames)
-
-        # Initial actor image is the idle one
-        self.actor_idle_image = pygame.image.load(get_asset_path('Bakunawa Assets/Pictures/Sprites/Tao/abatang1.png')).convert_alpha()
-        self.actor_idle_image = pygame.transform.scale(self.actor_idle_image, (160, 160))
-        self.current_actor_image = self.actor_idle_image # Set initial image here
+        self.actor_animation_duration_frames = 4 # abatang1..4
+        self.actor_size = 160
         self.actor_pos_x = 69
         self.actor_pos_y = 509
 
         # New: Store the target word for projectile generation after actor animation
         self.projectile_pending_target = None 
+        self.projectile_pending_generation = 0 # Word.generation of the target, it may be destroyed before the launch
+        self.launch_on_keypress = launch_on_keypress
+
+        self.bulalakaw_assets = BULALAKAW_ASSETS
+        # Warm the sprite cache so generating a level never touches the disk
+        meteor_frames = Bulalakaw.load_frames(self.bulalakaw_assets)
+        self.meteorite_w, self.meteorite_h = meteor_frames[0].get_size()
+
+        # Words that fit on a meteor, per difficulty, drawn through shuffle bags so they don't repeat
+        self.word_index = WordIndex(self.lexicon, self.fonts['word'], f'{WORD_FONT_PATH}:{WORD_FONT_SIZE}', self.meteorite_w - 10)
+        self.word_bags = {}
+        # The next level is planned while the current one runs (see start_prefetch)
+        self.background_prefetch = background_prefetch
+        self.prefetch_thread = None
+        self.prefetched_plan = None
 
-        moon_lives_paths = [
-            'Bakunawa Assets/Pictures/Sprites/Moon/Buwan_1.png',
-            'Bakunawa Assets/Pictures/Sprites/Moon/Buwan_2.png',
-            'Bakunawa Assets/Pictures/Sprites/Moon/Buwan_3.png',
-            'Bakunawa Assets/Pictures/Sprites/Moon/Buwan_4.png',
-            'Bakunawa Assets/Pictures/Sprites/Moon/Buwan_5.png',
-            'Bakunawa Assets/Pictures/Sprites/Moon/Buwan_6.png',
-            'Bakunawa Assets/Pictures/Sprites/Moon/Buwan_7.png',
-            'Bakunawa Assets/Pictures/Sprites/Moon/Buwan_8.png'  # Game over image
-        ]
-
-        self.lives_indicator = LivesIndicator(
-            image_paths=moon_lives_paths,
-            xpos=819,
-            ypos=540,
-            width=160,
-            height=160,
-            max_lives=7
-        )
-
-        self.bulalakaw_assets = {
-            "falling": 'Bakunawa Assets/Pictures/Sprites/Bulalakaw/Falling/Bulalakaw_{}.png',
-            "boom": 'Bakunawa Assets/Pictures/Sprites/Bulalakaw/Boom/Sabog_{}.png'
-        }
-        
         # Projectile setup (now SoundWaveProjectile)
         self.projectiles = [] # List to hold active projectile objects (SoundWaveProjectile instances)
+        self.broadphase = SpatialHash() # Typed meteors by grid cell, for projectiles without a live target
+        self.entities = None # EntityStore of the 'numpy' backend, None when entities update themselves
+        if entity_backend == 'numpy':
+            if numpy is None:
+                print("Warning: NumPy is not installed, using the python entity backend")
+            else:
+                self.entities = EntityStore()
 
         # Difficulty choices
         self.choices = [True, False, False] # [Madali, Katamtaman, Mahirap]
         self.last_choices_before_pause = copy.deepcopy(self.choices)
 
-    def load_assets(self):
-        """Loads all game assets (images, fonts, sounds)."""
-        assets = {}
-        assets['bg_img'] = pygame.image.load(get_asset_path('Download/bakunawa_landscape.png')).convert()
-        
-        # Load Abatang (Gong Banging) animation frames
-        self.abatang_frames = []
-        for i in range(1, 5):
-            path = get_asset_path(f'Bakunawa Assets/Pictures/Sprites/Tao/abatang{i}.png')
-            try:
-                img = pygame.image.load(path).convert_alpha()
-                img = pygame.transform.scale(img, (160, 160))
-                self.abatang_frames.append(img)
-            except pygame.error as e:
-                print(f"Warning: Could not load abatang frame {path}: {e}")
-                if not self.abatang_frames: # If first frame fails, use a generic fallback
-                    placeholder_path = get_asset_path('Bakunawa Assets/Pictures/Sprites/Tao/abatang1.png')
-                    try:
-                        placeholder_img = pygame.image.load(placeholder_path).convert_alpha()
-                        placeholder_img = pygame.transform.scale(placeholder_img, (160, 160))
-                        self.abatang_frames.append(placeholder_img)
-                    except pygame.error as ee:
-                        print(f"CRITICAL ERROR: Could not load even the fallback actor image: {ee}")
-                        self.abatang_frames.append(pygame.Surface((160,160), pygame.SRCALPHA)) # Blank surface
-                        self.abatang_frames[0].fill((0,0,0,255))
-                else: # If later frames fail, just duplicate the last successful frame
-                    self.abatang_frames.append(self.abatang_frames[-1])
-
-        assets['moon_tanga'] = pygame.image.load(get_asset_path('Bakunawa Assets/Pictures/Sprites/Moon/moontanga.png')).convert_alpha()
-
-        assets['fonts'] = {
-            'karatula': pygame.font.Font(get_asset_path('Bakunawa Assets/Fonts/LL KARATULA 020721.ttf'), 30),
-            'karatula_65': pygame.font.Font(get_asset_path('Bakunawa Assets/Fonts/LL KARATULA 020721.ttf'), 65),
-            'karatula_25': pygame.font.Font(get_asset_path('Bakunawa Assets/Fonts/LL KARATULA 020721.ttf'), 25),
-            'karatula_45': pygame.font.Font(get_asset_path('Bakunawa Assets/Fonts/LL KARATULA 020721.ttf'), 45),
-            'square': pygame.font.Font(get_asset_path('Bakunawa Assets/Fonts/Square.ttf'), 50),
-            'kawit': pygame.font.Font(get_asset_path('Bakunawa Assets/Fonts/KawitFree-CndItalic.ttf'), 85),
-            'martiresExtraBold': pygame.font.Font(get_asset_path('Bakunawa Assets/Fonts/BBTMartiresFree-ExtraBold.ttf'), 55),
-            'pause': pygame.font.Font(get_asset_path('Bakunawa Assets/Fonts/1up.ttf'), 38),
-            'word': pygame.font.Font(get_asset_path('Bakunawa Assets/Fonts/GentiumPlus-Bold.ttf'), 38)
-        }
-
-        # Load sound effects
-        try:
-            assets['gong_sfx'] = pygame.mixer.Sound(get_asset_path('Bakunawa Assets/Sounds/Sfx/sfx_gong.wav'))
-        except pygame.error as e:
-            print(f"Warning: Could not load gong sound effect: {e}")
-            assets['gong_sfx'] = None # Set to None if loading fails
-
-        return assets
-
-    def generate_level(self):
-        """Generates words for the current level based on chosen difficulty."""
-        word_objs = []
-        if self.choices[0]: # Madali
-            wordlist = self.madali_words
-        elif self.choices[1]: # Katamtaman
-            wordlist = self.katamtaman_words
-        elif self.choices[2]: # Mahirap
-            wordlist = self.mahirap_words
-        else: # Default to Madali if no choice is made
-            wordlist = self.madali_words
-
-        if not wordlist:
+    def difficulty_index(self):
+        """Returns the selected difficulty: 0 Madali, 1 Katamtaman, 2 Mahirap (Madali if none is selected)."""
+        for index, selected in enumerate(self.choices):
+            if selected:
+                return index
+        return 0 # Default to Madali if no choice is made
+
+    def word_bag(self, difficulty):
+        """Returns the shuffle bag of the difficulty's words that fit on a meteor, created on first use."""
+        bag = self.word_bags.get(difficulty)
+        if bag is None:
+            bag = ShuffleBag(self.word_index.fitting(DIFFICULTY_NAMES[difficulty]), self.rng)
+            self.word_bags[difficulty] = bag
+        return bag
+
+    def set_language(self, language):
+        """
+        Switches the words to another WIKA language from the next level on. Its lexicon is mapped
+        (and its word index loaded) on first use; the words already falling stay.
+        """
+        if language == self.language:
+            return
+        self.take_prefetched_plan(None, None) # Planned with the old language's words
+        self.language = language
+        self.lexicon = LEXICONS[language]
+        self.word_index = WordIndex(self.lexicon, self.fonts['word'], f'{WORD_FONT_PATH}:{WORD_FONT_SIZE}', self.meteorite_w - 10)
+        self.word_bags = {}
+
+    def plan_level(self, level, difficulty, bag):
+        """
+        Picks the words of a level with their start positions and speeds. Uses only self.rng and bag
+        (no pygame calls), so it can run on the prefetch thread. Returns a LevelPlan, or None if no
+        words can be generated.
+        """
+        if not bag:
             print("Warning: Selected word list is empty. Cannot generate words.")
-            return []
-
-        sample_img = pygame.image.load(get_asset_path(self.bulalakaw_assets['falling'].format(1))).convert_alpha()
-        meteorite_w, meteorite_h = sample_img.get_size()
-
-        occupied_x = [] # To store x-ranges of placed words for collision detection
-        words_needed = self.level
-        attempts = 0
-        max_attempts = 1000
-
-        while len(word_objs) < words_needed and attempts < max_attempts:
-            text = random.choice(wordlist).lower()
-            text_surface = self.fonts['word'].render(text.upper(), True, (255, 255, 255))
-            text_w = text_surface.get_width()
-
-            left_pad = 50
-            right_pad = 50
-            min_spacing = 60 # Minimum horizontal spacing between meteorites
-            max_x = WIDTH - meteorite_w - right_pad
-
-            if max_x < left_pad or text_w > meteorite_w - 10:
-                attempts += 1
-                continue
-
-            found_x = False
-            inner_attempts = 0
-            max_inner = 50
-
-            while not found_x and inner_attempts < max_inner:
-                xpos = random.randint(left_pad, max_x)
-
-                overlap = False
-                for (start_x, end_x) in occupied_x:
-                    new_left = xpos - min_spacing
-                    new_right = xpos + meteorite_w + min_spacing
-                    exist_left = start_x - min_spacing
-                    exist_right = end_x + min_spacing
-                    if not (new_right < exist_left or new_left > exist_right):
-                        overlap = True
-                        break
-
-                if not overlap:
-                    found_x = True
-                inner_attempts += 1
-
-            if found_x:
-                ypos = -meteorite_h - random.randint(10, 50) # Start slightly off-screen
-                speed = random.randint(4, 5) # Bulalakaw speed
-                new_word = Word(text, speed, xpos, ypos, self.fonts, self.bulalakaw_assets)
-                word_objs.append(new_word)
-                occupied_x.append((xpos, xpos + meteorite_w))
-                attempts = 0
-            else:
-                attempts += 1
+            return None
+
+        meteorite_w, meteorite_h = self.meteorite_w, self.meteorite_h
+
+        words_needed = level
+        plan = LevelPlan(level, difficulty, words_needed)
+
+        left_pad = 50
+        right_pad = 50
+        min_spacing = 60 # Minimum horizontal spacing between meteorites
+        row_gap = 40 # Vertical gap between rows of meteorites
+        max_x = WIDTH - meteorite_w - right_pad
+        if max_x < left_pad:
+            print("Warning: Meteorites are too wide for the screen. Cannot generate words.")
+            return None
+
+        # Meteors are placed in rows: each one takes a uniformly drawn free x of its row and blocks the
+        # x values that would come closer than min_spacing. A full row starts a new one higher up,
+        # so any number of meteors fits and later rows simply arrive later.
+        row = 0
+        free_x = FreeIntervals(left_pad, max_x)
+        earlier_rows = {} # Speed -> sorted x of the meteors in the rows before this one
+        this_row = []
+        while len(plan.placements) < words_needed:
+            if not free_x.free_count():
+                row += 1
+                free_x = FreeIntervals(left_pad, max_x)
+                for x, speed in this_row:
+                    bisect.insort(earlier_rows.setdefault(speed, []), x)
+                this_row = []
+
+            # Every word in the bag is already known to fit on a meteor, no need to render it
+            word_id, text_w = bag.draw()
+            text, normalized = self.lexicon.text(word_id), self.lexicon.key(word_id)
+            xpos = free_x.sample(self.rng)
+            free_x.remove(xpos - meteorite_w - 2 * min_spacing, xpos + meteorite_w + 2 * min_spacing)
+
+            ypos = -meteorite_h - self.rng.randint(10, 50) - row * (meteorite_h + row_gap) # Start off-screen
+            speed = self.rng.randint(4, 5) # Bulalakaw speed
+            # Never faster than a meteor of an earlier row in the same column, or it would catch up with it
+            for other_speed in sorted(earlier_rows):
+                if other_speed >= speed:
+                    break
+                xs = earlier_rows[other_speed]
+                i = bisect.bisect_right(xs, xpos - meteorite_w)
+                if i < len(xs) and xs[i] < xpos + meteorite_w:
+                    speed = other_speed
+                    break
+            this_row.append((xpos, speed))
+            plan.placements.append((text, normalized, text_w, xpos, ypos, speed))
 
-        if len(word_objs) < words_needed:
-            print(f"Warning: only generated {len(word_objs)} words for level {self.level}")
+        return plan
 
-        self.words_generated_this_level = len(word_objs)
+    def generate_level(self):
+        """
+        Generates words for the current level based on chosen difficulty. Uses the plan prefetched
+        during the previous level when it is still valid, then starts prefetching the next one.
+        The words themselves are created over the following steps by spawn_due().
+        """
+        self.word_objects = []
+        self.spawn_queue.clear()
+        difficulty = self.difficulty_index()
+        plan = self.take_prefetched_plan(self.level, difficulty)
+        if plan is None:
+            plan = self.plan_level(self.level, difficulty, self.word_bag(difficulty))
+            if plan is None:
+                return
+
+        self.schedule_level(plan)
+        self.start_prefetch(self.level + 1, difficulty)
+
+    def schedule_level(self, plan):
+        """
+        Turns a LevelPlan into a timeline: each meteor is due on the tick its fall brings it down to the
+        start band of the first row, so rows placed higher up are created later instead of all at once.
+        """
+        if len(plan.placements) < plan.words_needed:
+            print(f"Warning: only generated {len(plan.placements)} words for level {plan.level}")
+
+        spawn_line = -self.meteorite_h - 50 # Highest start of the first row
+        timeline = []
+        for placement in plan.placements:
+            ypos, speed = placement[4], placement[5]
+            timeline.append((max(0, math.ceil((spawn_line - ypos) / speed)), placement))
+        timeline.sort(key=lambda entry: entry[0]) # Stable, so the plan order is kept within a tick
+        self.spawn_queue.extend(timeline)
+        self.level_tick = 0
+
+        # The whole level counts from the start, so it can't complete while meteors are still due
+        self.words_generated_this_level = len(plan.placements)
         self.words_typed_this_level = 0
         self.words_missed_this_level = 0
 
-        return word_objs
+    def spawn_due(self):
+        """Creates the meteors due by now, at most SPAWNS_PER_STEP per step."""
+        queue = self.spawn_queue
+        spawned = []
+        if queue and queue[0][0] <= self.level_tick:
+            disk_loads_before = SPRITE_CACHE.disk_loads
+            while queue and queue[0][0] <= self.level_tick and len(spawned) < SPAWNS_PER_STEP:
+                _, (text, normalized, text_w, xpos, ypos, speed) = queue.popleft()
+                # Placed where it would be had it been falling since the level started (also if it had to wait)
+                ypos += speed * self.level_tick
+                new_word = WORD_POOL.acquire(text, speed, xpos, ypos, self.fonts, self.bulalakaw_assets,
+                                             normalized_text=normalized, text_width=text_w)
+                spawned.append(new_word)
+                self.word_objects.append(new_word)
+                if self.entities is not None:
+                    self.entities.add_word(new_word)
+            self.matcher.add_words(spawned)
+            if SPRITE_CACHE.disk_loads != disk_loads_before:
+                print(f"Warning: level {self.level} loaded {SPRITE_CACHE.disk_loads - disk_loads_before} sprites from disk ({SPRITE_CACHE.stats()})")
+        self.level_tick += 1
+
+    def start_prefetch(self, level, difficulty):
+        """
+        Plans the given level ahead of time, on a worker thread if background_prefetch is set.
+        Either way the plan is made at this point of the game and consumes the same random numbers,
+        so threaded and headless runs stay identical.
+        """
+        bag = self.word_bag(difficulty) # Created here on the main thread, the worker only draws from it
+        if self.background_prefetch:
+            self.prefetch_thread = threading.Thread(target=self.run_prefetch, args=(level, difficulty, bag), daemon=True)
+            self.prefetch_thread.start()
+        else:
+            self.run_prefetch(level, difficulty, bag)
+
+    def run_prefetch(self, level, difficulty, bag):
+        self.prefetched_plan = self.plan_level(level, difficulty, bag)
+
+    def take_prefetched_plan(self, level, difficulty):
+        """
+        Waits for the prefetch to finish (the rng and word bags are the worker's until then) and
+        returns its plan if it was made for this level and difficulty, otherwise None.
+        """
+        if self.prefetch_thread is not None:
+            self.prefetch_thread.join()
+            self.prefetch_thread = None
+        plan, self.prefetched_plan = self.prefetched_plan, None
+        if plan is not None and plan.level == level and plan.difficulty == difficulty:
+            return plan
+        return None
 
     def check_answer(self):
         """Checks if the typed string matches any active word."""
         word_typed = None
-        normalized_submit = remove_accents(self.submit.lower())
-        for word in self.word_objects:
-            if not word.typed: # Only consider words that haven't been typed yet
-                normalized_word = remove_accents(word.text.lower())
-                if normalized_word == normalized_submit:
-                    word_typed = word
-                    break
+        for word in self.matcher.find(self.submit):
+            # Only consider words that haven't been typed yet and are still falling (not released to the pool)
+            if not word.typed and word.bulalakaw is not None:
+                word_typed = word
+                break
 
         if word_typed:
             # Calculate score based on word length and speed
@@ -582,48 +2699,542 @@ class Game:
             self.words_typed_this_level += 1
             word_typed.trigger_typed() # Mark as typed. Meteor continues falling.
 
+            self.answered(word_typed)
+
             # Trigger actor animation for "shooting" (gong banging)
             self.actor_is_animating = True
             self.actor_current_frame = 0
             self.actor_animation_timer = 0.0
             
-            # Instead of creating the projectile here, store the target word
-            self.projectile_pending_target = word_typed
+            if self.launch_on_keypress:
+                # The wave leaves right away, the animation plays alongside it
+                self.play_gong()
+                self.launch_projectile(word_typed)
+            else:
+                # Instead of creating the projectile here, store the target word
+                self.projectile_pending_target = word_typed
+                self.projectile_pending_generation = word_typed.generation
             
         self.submit = '' # Clear submitted string after checking
 
-    def draw_screen(self, mouse_pos, mouse_clicked):
-        """Draws the main game screen elements."""
-        self.screen.fill((0, 0, 0))
-        self.bg.draw(self.screen)
+    def answered(self, word):
+        """Called when check_answer matched word. Game times it."""
+        pass
+
+    def play_gong(self):
+        """Called when the gong is struck. The simulation is silent, Game plays the sound."""
+        pass
+
+    def reset_progress(self):
+        """Starts over from level 1 with full lives and no score."""
+        self.level = 1
+        self.new_level = True
+        self.score = 0
+        self.lives = LIVES_START
+        self.take_prefetched_plan(None, None) # Drops the plan for the old game's next level
+        for word in self.word_objects:
+            self.release_word(word)
+        self.word_objects = []
+        self.spawn_queue.clear()
+        self.matcher.clear()
+        self.projectile_pending_target = None
+        self.words_generated_this_level = 0
+        self.words_typed_this_level = 0
+        self.words_missed_this_level = 0
+
+    def pause(self):
+        """Pauses the game, remembering the difficulty to detect changes made in the pause menu."""
+        self.paused = True
+        self.last_choices_before_pause = copy.deepcopy(self.choices)
+
+    def resume(self):
+        """Leaves the pause menu. Changing the difficulty restarts from level 1."""
+        self.paused = False
+        # Reset level if difficulty changed during pause
+        if self.choices != self.last_choices_before_pause:
+            self.reset_progress()
+        self.last_choices_before_pause = copy.deepcopy(self.choices)
+
+    def restart(self):
+        """Continues after game over, going to the pause menu to pick a difficulty."""
+        self.game_over = False
+        self.reset_progress()
+        self.active_string = ''
+        self.matcher.reset_input()
+        self.submit = ''
+        self.pause() # Go to pause screen to select difficulty
+
+    def select_difficulty(self, index):
+        """Selects Madali (0), Katamtaman (1) or Mahirap (2)."""
+        for j in range(len(self.choices)):
+            self.choices[j] = (index == j)
+
+    def apply_action(self, action, arg=''):
+        """
+        Applies one input action: 'type' (arg is the text), 'backspace', 'submit', 'escape',
+        'difficulty' (arg is the index), 'language' (arg is the WIKA index), or the menu buttons
+        'pause', 'resume' and 'restart'.
+        Typing is ignored while paused or game over. Every action goes through here so it can be recorded.
+        """
+        if self.replay is not None:
+            self.replay.record(self.tick, action, arg)
+
+        # Handle ESCAPE key for pause/unpause, always allowed
+        if action == 'escape':
+            if self.paused:
+                self.resume()
+            else:
+                self.pause()
+            return
+        if action == 'difficulty':
+            self.select_difficulty(int(arg))
+            return
+        if action == 'language':
+            self.set_language(WIKA[int(arg)])
+            return
+        if action == 'pause':
+            self.pause()
+            return
+        if action == 'resume':
+            self.resume()
+            return
+        if action == 'restart':
+            self.restart()
+            return
+
+        # These inputs should only be processed if the game is NOT paused and NOT game over
+        if self.paused or self.game_over:
+            return
+        if action == 'type':
+            self.active_string += arg
+            self.matcher.push(arg)
+        elif action == 'backspace':
+            if self.active_string:
+                self.active_string = self.active_string[:-1]
+                self.matcher.pop()
+        elif action == 'submit':
+            self.submit = self.active_string.lower()
+            self.check_answer() # Call check_answer immediately on RETURN
+            self.active_string = ''
+            self.matcher.reset_input()
+
+    def handle_event(self, event):
+        """Translates a pygame keyboard event into an input action."""
+        if event.type == pygame.TEXTINPUT:
+            self.apply_action('type', event.text)
+        elif event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_BACKSPACE:
+                self.apply_action('backspace')
+            elif event.key == pygame.K_RETURN:
+                self.apply_action('submit')
+            elif event.key == pygame.K_ESCAPE:
+                self.apply_action('escape')
+
+    def launch_projectile(self, word_to_hit):
+        """Sends a sound wave from the actor's gong towards word_to_hit."""
+        if word_to_hit.bulalakaw is None:
+            return # Released (e.g. missed) before the wave left, nothing to aim at
+        projectile_start_x, projectile_start_y = self.projectile_origin()
         
-        self.lives_indicator.draw(self.screen, self.lives if self.lives >= 0 else 0)
+        projectile_target_x = word_to_hit.bulalakaw.rect.centerx
+        projectile_target_y = word_to_hit.bulalakaw.rect.centery
         
-        # Draw the dynamically updated actor image (idle or animating)
-        self.screen.blit(self.current_actor_image, (self.actor_pos_x, self.actor_pos_y))
+        new_projectile = PROJECTILE_POOL.acquire(
+            projectile_start_x, 
+            projectile_start_y, 
+            projectile_target_x, 
+            projectile_target_y,
+            speed=PROJECTILE_SPEED, 
+            base_radius=20, 
+            thickness=4, 
+            color=(49, 149, 149), # You can change this color here
+            target=word_to_hit
+        ) 
+        self.projectiles.append(new_projectile)
+        if self.entities is not None:
+            self.entities.add_projectile(new_projectile)
+
+    def projectile_origin(self):
+        """Where sound waves leave the gong."""
+        return (self.actor_pos_x + self.actor_size // 2 + 30, self.actor_pos_y + self.actor_size // 2 - 20)
+
+    def update_actor(self, delta_time):
+        """Advances the gong animation and launches the pending projectile when it ends."""
+        if self.actor_is_animating:
+            self.actor_animation_timer += self.actor_animation_speed * delta_time
+            
+            # Check if animation is completing this frame
+            if self.actor_animation_timer >= self.actor_animation_duration_frames:
+                # Play gong sound effect here (already played on the keypress if the wave left then)
+                if not self.launch_on_keypress:
+                    self.play_gong()
+
+                self.actor_is_animating = False
+                self.actor_current_frame = 0
+                self.actor_animation_timer = 0.0
+
+                # Launch projectile ONLY when animation is done and there's a pending target
+                target = self.projectile_pending_target
+                if target and target.generation == self.projectile_pending_generation:
+                    self.launch_projectile(target)
+                    self.projectile_pending_target = None 
+            else:
+                self.actor_current_frame = int(self.actor_animation_timer)
+                self.actor_current_frame = min(self.actor_current_frame, self.actor_animation_duration_frames - 1)
+
+    def update_words(self, delta_time):
+        """Moves the words and removes the ones that were destroyed or missed."""
+        if self.entities is not None:
+            removable = self.entities.update_words(delta_time)
+            self.entities.sync_words(self.word_objects)
+            if removable.any():
+                rows = set(numpy.flatnonzero(removable).tolist())
+                for index in range(len(self.word_objects) - 1, -1, -1):
+                    if self.word_objects[index].store_index in rows:
+                        self.remove_word_at(index)
+            return
+
+        # Walk backwards so swap_remove only moves words that were already updated
+        for index in range(len(self.word_objects) - 1, -1, -1):
+            if self.word_objects[index].update(delta_time): 
+                self.remove_word_at(index)
+
+    def remove_word_at(self, index):
+        """Removes a destroyed or missed word, costing a life if it was missed."""
+        word = self.word_objects[index]
+        if not word.hit_by_projectile and word.get_bottom() > HEIGHT: 
+            self.lives -= 1
+            self.words_missed_this_level += 1
+        swap_remove(self.word_objects, index)
+        self.matcher.remove_word(word)
+        self.release_word(word)
+
+    def release_word(self, word):
+        """Returns a word that left the game to its pool."""
+        if self.entities is not None:
+            self.entities.remove_word(word)
+        WORD_POOL.release(word)
+
+    def release_projectile(self, proj):
+        """Returns a projectile that left the game to its pool."""
+        if self.entities is not None:
+            self.entities.remove_projectile(proj)
+        PROJECTILE_POOL.release(proj)
+
+    def update_projectiles(self, delta_time):
+        """Moves the projectiles and checks them against the typed words."""
+        if self.entities is not None:
+            done = self.entities.update_projectiles(delta_time, self.bounds, self.projectiles)
+            self.entities.sync_projectiles(self.projectiles)
+            if done.any():
+                for index in range(len(self.projectiles) - 1, -1, -1):
+                    proj = self.projectiles[index]
+                    if proj.done:
+                        swap_remove(self.projectiles, index)
+                        self.release_projectile(proj)
+            return
+
+        broadphase_built = False
+        for index in range(len(self.projectiles) - 1, -1, -1):
+            proj = self.projectiles[index]
+            proj.update(delta_time, self.bounds)
+            
+            if not proj.done:
+                # Collision logic for SoundWaveProjectile:
+                # A wave only has to test the meteor it was sent at. If that one is gone or already hit,
+                # the spatial hash gives the typed, not yet hit meteors near it instead of all of them.
+                if proj.has_live_target():
+                    candidates = (proj.target,)
+                else:
+                    if not broadphase_built:
+                        self.build_broadphase()
+                        broadphase_built = True
+                    candidates = self.broadphase.query(proj.rect)
+                for word in candidates:
+                    if word.typed and not word.hit_by_projectile and proj.rect.colliderect(word.bulalakaw.rect):
+                        word.trigger_boom_from_hit()
+                        proj.done = True 
+                        break 
+
+            if proj.done: 
+                swap_remove(self.projectiles, index)
+                self.release_projectile(proj)
+
+    def clear_projectiles(self):
+        """Removes every projectile in flight."""
+        for proj in self.projectiles:
+            self.release_projectile(proj)
+        self.projectiles = []
+
+    def build_broadphase(self):
+        """Rebuilds the spatial hash from the meteors a projectile can still hit."""
+        self.broadphase.clear()
+        for word in self.word_objects:
+            if word.typed and not word.hit_by_projectile:
+                self.broadphase.insert(word, word.bulalakaw.rect)
+
+    def step(self, delta_time=FIXED_DT):
+        """Advances the game by one fixed timestep. Does nothing while paused or game over."""
+        if self.paused or self.game_over:
+            return
+        self.tick += 1
+
+        if self.new_level:
+            with self.timer.scope('generate_level'):
+                self.generate_level()
+            self.new_level = False
+        with self.timer.scope('spawn'):
+            self.spawn_due()
+
+        with self.timer.scope('actor_update'):
+            self.update_actor(delta_time)
+        with self.timer.scope('word_update'):
+            self.update_words(delta_time)
+        with self.timer.scope('projectile_update'):
+            self.update_projectiles(delta_time)
+
+        # Level completion logic
+        if self.words_typed_this_level + self.words_missed_this_level >= self.words_generated_this_level and self.words_generated_this_level > 0:
+            if len(self.word_objects) == 0 and len(self.projectiles) == 0 and not self.spawn_queue:
+                self.level += 1
+                self.new_level = True
+
+        # Game over condition
+        if self.lives <= 0:
+            self.game_over = True
+            self.lives = 0 
+
+    def run(self, ticks, script=()):
+        """
+        Steps the simulation ticks times without rendering. script is an iterable of
+        (tick, action, arg) entries applied through apply_action right before that tick.
+        """
+        pending = sorted(script, key=lambda entry: entry[0])
+        index = 0
+        for _ in range(ticks):
+            while index < len(pending) and pending[index][0] <= self.tick:
+                self.apply_action(*pending[index][1:])
+                index += 1
+            self.step(FIXED_DT)
+        return self
+
+class Game(GameSimulation):
+    """Main game class managing game state, assets, and loop."""
+    def __init__(self, language=LANGUAGE, render_mode=RENDER_MODE, seed=None, entity_backend=ENTITY_BACKEND,
+                 render_backend=RENDER_BACKEND, render_scale=RENDER_SCALE, launch_on_keypress=LAUNCH_ON_KEYPRESS):
+        if render_backend == 'texture' and sdl2_video is None:
+            print("Warning: pygame._sdl2 is not available, using the 'surface' render backend")
+            render_backend = 'surface'
+        self.render_backend = render_backend
+        self.auto_render_scale = render_scale == 'auto'
+        render_scale = AUTO_SCALE_STEPS[0] if self.auto_render_scale else float(render_scale)
+        if (render_scale != 1.0 or self.auto_render_scale) and (render_backend != 'surface' or render_mode != 'dirty'):
+            print("Warning: the render scale needs the 'surface' backend in 'dirty' mode, rendering at full size")
+            render_scale, self.auto_render_scale = 1.0, False
+        self.render_frame_times = [] # Frame work times the auto render scale decides on
+        self.render_scale_means = {} # Render scale -> mean frame work (ms) measured at it
+        self.render_scale_floor = AUTO_SCALE_STEPS[-1] # Raised when a lower scale turned out not to be faster
+        if render_backend == 'texture':
+            self.screen = TextureScreen((WIDTH, HEIGHT), "Bakunawa: Typing Game")
+        else:
+            self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
+            pygame.display.set_caption("Bakunawa: Typing Game")
+            if render_scale != 1.0 or self.auto_render_scale:
+                # Set before any asset loads, so the loaders pre-scale the sprites
+                self.screen = ScaledScreen(self.screen, render_scale)
+        self.clock = pygame.time.Clock()
+        self.time_accumulator = 0.0 # Real time not yet consumed by fixed simulation steps
+
+        self.assets = self.load_assets()
+        self.bg = Image(self.assets['bg_img'].get(), WIDTH, HEIGHT, 0, 0)
+        # Load the gong sound effect
+        self.gong_sfx = self.assets['gong_sfx']
+
+        super().__init__(language, fonts=self.assets['fonts'], seed=seed, entity_backend=entity_backend,
+                         background_prefetch=True, launch_on_keypress=launch_on_keypress)
+        if render_backend == 'texture':
+            self.renderer = TextureRenderer(self.screen, self.build_background_layer())
+        else:
+            self.renderer = DirtyRectRenderer(self.screen, self.build_background_layer(), dirty=(render_mode == 'dirty'))
+        self.border_layer = self.build_border_layer()
+        self.actor_animation_duration_frames = len(self.abatang_frames)
+
+        # Initial actor image is the idle one
+        self.actor_idle_image = self.abatang_frames[0].get()
+        self.actor_size = self.actor_idle_image.get_width()
+
+        self.lives_indicator = LivesIndicator(
+            image_paths=MOON_LIVES_PATHS,
+            xpos=819,
+            ypos=540,
+            width=MOON_LIVES_SIZE[0],
+            height=MOON_LIVES_SIZE[1],
+            max_lives=7
+        )
+
+        self.profiler_hud = ProfilerHud(self.timer)
+        self.latency = LatencyTracker() # Submit key to boom on screen, shown in the profiler HUD
+        self.last_queue_read = time.perf_counter() # When SDL's event queue was last emptied
+        self.queued_since = None # (earliest, read) times of the events read from SDL for the next frame
+        self.queue_window = None # The same for the frame being handled
+
+        # Lives, level, score and the typed text, re-rendered only when they change
+        self.hud_text = HudText(self.fonts, {
+            'lives': ('karatula_65', (1060, 605), '{}'),
+            'level': ('karatula', (20, 60), 'Antas: {}'),
+            'active_string': ('kawit', (260, 582), '{}'),
+            'score': ('karatula', (545, 35), 'Puntos: {}'),
+        })
+        self.pause_button = Button(1130, 60, 'II', self.fonts['pause'], None)
+
+        # Input actions are recorded for replays, and a ReplayPlayer drives the game while one plays
+        if RECORD_REPLAYS:
+            self.replay = Replay(self.seed, self.choices, self.word_index.key, self.launch_on_keypress, self.language)
+        self.player = None
+        self.replay_speed = 1.0
+
+        # Pause and game over overlays are rendered once and re-composed only when a button changes
+        self.pause_overlay = CachedOverlay((WIDTH, HEIGHT))
+        self.game_over_overlay = CachedOverlay((WIDTH, HEIGHT))
+        self.resume_button = Button(305, 230, '>', self.fonts['pause'], None)
+        self.quit_button = Button(705, 230, 'X', self.fonts['pause'], None)
+        self.difficulty_buttons = [
+            Button(405, 349, 'MADALI', self.fonts['square'], None),
+            Button(405, 435, 'KATAMTAMAN', self.fonts['square'], None),
+            Button(405, 520, 'MAHIRAP', self.fonts['square'], None),
+        ]
+        self.continue_button = Button(450, 400, '>', self.fonts['pause'], None)
+        self.exit_button = Button(450, 500, 'X', self.fonts['pause'], None)
+
+    def load_assets(self):
+        """Sets up handles for all game assets (images, fonts, sounds). Each one loads on first use."""
+        assets = {}
+        assets['bg_img'] = LazyAsset(BACKGROUND_PATH, lambda: SPRITE_CACHE.load(BACKGROUND_PATH, alpha=False))
         
-        # UI rectangles and borders
-        pygame.draw.rect(self.screen, pygame.Color('white'), (250, 570, 550, 100), 1, border_radius=20)
-        pygame.draw.rect(self.screen, pygame.Color('white'), (1000, 571, 170, 100), 1, border_radius=20)
-        pygame.draw.rect(self.screen, pygame.Color('white'), (0, 0, WIDTH, HEIGHT), 3)
-        pygame.draw.rect(self.screen, pygame.Color('black'), (0, 0, WIDTH, HEIGHT), 2)
+        # Abatang (Gong Banging) animation frames, loaded when the animation first reaches them
+        self.abatang_frames = [LazyAsset(path, lambda i=i: self.load_abatang_frame(i)) for i, path in enumerate(ABATANG_PATHS, 1)]
+
+        assets['moon_tanga'] = LazyAsset(MOON_TANGA_PATH, lambda: SPRITE_CACHE.load(MOON_TANGA_PATH))
+
+        assets['fonts'] = load_fonts()
+
+        # Sound effects
+        assets['gong_sfx'] = LazyAsset('Bakunawa Assets/Sounds/Sfx/sfx_gong.wav', self.load_gong)
+
+        return assets
+
+    def load_abatang_frame(self, i):
+        """Loads abatang frame i (1-4), falling back to the previous frame or a blank one."""
+        path = ABATANG_PATHS[i - 1]
+        try:
+            return SPRITE_CACHE.load(path, ABATANG_SIZE)
+        except (pygame.error, OSError) as e:
+            print(f"Warning: Could not load abatang frame {path}: {e}")
+            if i > 1: # If later frames fail, just duplicate the last successful frame
+                return self.abatang_frames[i - 2].get()
+            print("CRITICAL ERROR: Could not load even the first actor image")
+            placeholder_img = pygame.Surface(ABATANG_SIZE, pygame.SRCALPHA) # Blank surface
+            placeholder_img.fill((0,0,0,255))
+            return placeholder_img
+
+    def load_gong(self):
+        """Loads the gong sound effect, or returns None if it can't be loaded."""
+        try:
+            return pygame.mixer.Sound(get_asset_path('Bakunawa Assets/Sounds/Sfx/sfx_gong.wav'))
+        except pygame.error as e:
+            print(f"Warning: Could not load gong sound effect: {e}")
+            return None # Set to None if loading fails
+
+    @property
+    def current_actor_image(self):
+        """The actor frame to draw: the gong animation while it plays, otherwise the idle image."""
+        if self.actor_is_animating:
+            return self.abatang_frames[self.actor_current_frame].get()
+        return self.actor_idle_image
+
+    def play_gong(self):
+        """Plays the gong sound effect, if it loaded."""
+        gong_sfx = self.gong_sfx.get() if self.gong_sfx else None
+        if gong_sfx:
+            gong_sfx.play()
+
+    def build_background_layer(self):
+        """Renders the background image and the static UI chrome once, for the dirty-rect renderer."""
+        layer = pygame.Surface((WIDTH, HEIGHT))
+        if pygame.display.get_surface() is not None: # The 'texture' backend has no display surface
+            layer = layer.convert()
+        layer.fill((0, 0, 0))
+        self.bg.draw(layer)
+        self.draw_static_chrome(layer)
+        return layer
+
+    def build_border_layer(self):
+        """Renders the screen border alone on a transparent layer, to put it back over sprites touching the edge."""
+        layer = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+        self.draw_border(layer)
+        return layer
+
+    def draw_static_chrome(self, surface):
+        """Draws the UI rectangles, borders and fixed labels."""
+        pygame.draw.rect(surface, pygame.Color('white'), (250, 570, 550, 100), 1, border_radius=20)
+        pygame.draw.rect(surface, pygame.Color('white'), (1000, 571, 170, 100), 1, border_radius=20)
+        self.draw_border(surface)
+        surface.blit(self.fonts['karatula_25'].render(f'Buwan:', True, pygame.Color("white")), (1020, 577))
+        surface.blit(self.fonts['karatula'].render(f'Wika: {self.language}', True, pygame.Color('white')), (20, 20))
+
+    def draw_border(self, surface):
+        """Draws the frame around the whole screen."""
+        pygame.draw.rect(surface, pygame.Color('white'), (0, 0, WIDTH, HEIGHT), 3)
+        pygame.draw.rect(surface, pygame.Color('black'), (0, 0, WIDTH, HEIGHT), 2)
+
+    def draw_screen(self, mouse_pos, mouse_clicked):
+        """Draws the main game screen elements."""
+        mark = self.renderer.mark
+        if self.renderer.uses_background:
+            # Background and static chrome come from the cached layer, only changed areas are restored
+            self.renderer.begin_frame()
+            lives_rect = mark(self.lives_indicator.draw(self.screen, self.lives if self.lives >= 0 else 0))
+            mark(self.screen.blit(self.current_actor_image, (self.actor_pos_x, self.actor_pos_y)))
+            # The moon touches the bottom edge, and the screen border is drawn on top of it
+            self.screen.blit(self.border_layer, lives_rect, lives_rect)
+        else:
+            self.renderer.begin_frame()
+            self.screen.fill((0, 0, 0))
+            self.bg.draw(self.screen)
+            
+            self.lives_indicator.draw(self.screen, self.lives if self.lives >= 0 else 0)
+            
+            # Draw the dynamically updated actor image (idle or animating)
+            self.screen.blit(self.current_actor_image, (self.actor_pos_x, self.actor_pos_y))
+            
+            # UI rectangles, borders and fixed labels
+            self.draw_static_chrome(self.screen)
 
         # Text elements
-        self.screen.blit(self.fonts['karatula_65'].render(f'{self.lives}', True, pygame.Color("white")), (1060, 605))
-        self.screen.blit(self.fonts['karatula_25'].render(f'Buwan:', True, pygame.Color("white")), (1020, 577))
-        self.screen.blit(self.fonts['karatula'].render(f'Wika: {WIKA[3]}', True, pygame.Color('white')), (20, 20))
-        self.screen.blit(self.fonts['karatula'].render(f'Antas: {self.level}', True, pygame.Color('white')), (20, 60))
-        self.screen.blit(self.fonts['kawit'].render(self.active_string, True, pygame.Color('white')), (260, 582))
-        self.screen.blit(self.fonts['karatula'].render(f'Puntos: {self.score}', True, pygame.Color('white')), (545, 35))
-
-        # Pause button
-        self.pause_button = Button(1130, 60, 'II', self.fonts['pause'], self.screen)
-        # Returns True if clicked, False otherwise
-        return self.pause_button.draw_circle_button(mouse_pos, mouse_clicked)
+        for rect in self.hud_text.draw(self.screen, {'lives': self.lives, 'level': self.level,
+                                                     'active_string': self.active_string, 'score': self.score}):
+            mark(rect)
+
+        # Pause button, returns True if clicked, False otherwise
+        pause_rect = self.pause_button.circle_rect()
+        pause_state = self.pause_button.get_state(pause_rect, mouse_pos, mouse_clicked)
+        mark(self.screen.blit(self.pause_button.circle_face(pause_state), pause_rect))
+        return pause_state == 'pressed'
 
     def draw_game_over(self, mouse_pos, mouse_clicked):
         """Draws the game over screen."""
-        face = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+        continue_state = self.continue_button.get_state(self.continue_button.circle_rect(), mouse_pos, mouse_clicked)
+        exit_state = self.exit_button.get_state(self.exit_button.circle_rect(), mouse_pos, mouse_clicked)
+
+        # The panel only changes with the score, the buttons only with the mouse
+        face = self.game_over_overlay.update(self.score, self.draw_game_over_base,
+                                             (continue_state, exit_state), self.draw_game_over_buttons)
+        self.screen.blit(face, (0, 0))
+
+        return continue_state == 'pressed', exit_state == 'pressed'
+
+    def draw_game_over_base(self, face):
+        """Draws the static part of the game over screen."""
         face.fill((0, 0, 0, 120))
         pygame.draw.rect(face, (*PALETTE['soft_red'], 150), [250, 120, 700, 490], 0, 5)
         pygame.draw.rect(face, (0,0,0,200), [250, 120, 700, 490], 5, 5)
@@ -639,10 +3250,6 @@ class Game:
         score_pos = (WIDTH // 2 - score_surface.get_width() // 2, 280)
         face.blit(score_surface, score_pos)
 
-        # Buttons
-        continue_button = Button(450, 400, '>', self.fonts['pause'], face)
-        exit_button = Button(450, 500, 'X', self.fonts['pause'], face)
-        
         con = "Maglaro ulit"
         con_face = self.fonts['karatula_45'].render(con, True, pygame.Color('white'))
         face.blit(con_face, (500, 377))
@@ -650,16 +3257,32 @@ class Game:
         ex_face = self.fonts['karatula_45'].render(ex, True, pygame.Color('white'))
         face.blit(ex_face, (500, 477))
 
-        clicked_continue = continue_button.draw_circle_button(mouse_pos, mouse_clicked)
-        clicked_exit = exit_button.draw_circle_button(mouse_pos, mouse_clicked)
-
-        self.screen.blit(face, (0, 0))
-
-        return clicked_continue, clicked_exit
+    def draw_game_over_buttons(self, face, states):
+        """Draws the game over buttons in their current states."""
+        continue_state, exit_state = states
+        self.continue_button.surface = face
+        self.exit_button.surface = face
+        self.continue_button.render_circle(continue_state)
+        self.exit_button.render_circle(exit_state)
 
     def draw_pause(self, mouse_pos, mouse_clicked):
         """Draws the pause menu."""
-        overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+        resume_state = self.resume_button.get_state(self.resume_button.circle_rect(), mouse_pos, mouse_clicked)
+        quit_state = self.quit_button.get_state(self.quit_button.circle_rect(), mouse_pos, mouse_clicked)
+        difficulty_states = tuple(btn.get_state(btn.rect_rect(), mouse_pos, mouse_clicked) for btn in self.difficulty_buttons)
+
+        for i, state in enumerate(difficulty_states):
+            if state == 'pressed':
+                self.apply_action('difficulty', i)
+
+        # Only recomposed when a button's hover/pressed state or the selected difficulty changes
+        state_key = (resume_state, quit_state, difficulty_states, tuple(self.choices))
+        overlay = self.pause_overlay.update(None, self.draw_pause_base, state_key, self.draw_pause_buttons)
+        self.screen.blit(overlay, (0, 0))
+        return resume_state == 'pressed', self.choices, quit_state == 'pressed'
+
+    def draw_pause_base(self, overlay):
+        """Draws the static part of the pause menu."""
         overlay.fill((0, 0, 0, 120))
         pygame.draw.rect(overlay, (0,0,0,100), [250, 120, 700, 490], 0, 5)
         pygame.draw.rect(overlay, (0,0,0,200), [250, 120, 700, 490], 5, 5)
@@ -669,218 +3292,273 @@ class Game:
         overlay.blit(self.fonts['karatula_45'].render('UMALIS', True, pygame.Color('white')), (754, 207))
         overlay.blit(self.fonts['karatula_45'].render('ANTAS', True, pygame.Color('white')), (538, 300))
 
-        self.resume_button = Button(305, 230, '>', self.fonts['pause'], overlay)
-        self.quit_button = Button(705, 230, 'X', self.fonts['pause'], overlay)
-        
-        resume_clicked = self.resume_button.draw_circle_button(mouse_pos, mouse_clicked)
-        quit_clicked = self.quit_button.draw_circle_button(mouse_pos, mouse_clicked)
-
-        madali_button = Button(405, 349, 'MADALI', self.fonts['square'], overlay)
-        katamtaman_button = Button(405, 435, 'KATAMTAMAN', self.fonts['square'], overlay)
-        mahirap_button = Button(405, 520, 'MAHIRAP', self.fonts['square'], overlay)
-        buttons = [madali_button, katamtaman_button, mahirap_button]
-
-        for i, btn in enumerate(buttons):
-            if btn.draw_rect_button(mouse_pos, mouse_clicked): # draw_rect_button now also returns clicked status
-                for j in range(len(self.choices)):
-                    self.choices[j] = (i == j)
-
-        button_rects = [(405, 349, 400, 70), (405, 435, 400, 70), (405, 520, 400, 70)]
-        for i, selected in enumerate(self.choices):
+    def draw_pause_buttons(self, overlay, states):
+        """Draws the pause menu buttons in their current states, and outlines the selected difficulty."""
+        resume_state, quit_state, difficulty_states, choices = states
+        for btn in [self.resume_button, self.quit_button] + self.difficulty_buttons:
+            btn.surface = overlay
+        self.resume_button.render_circle(resume_state)
+        self.quit_button.render_circle(quit_state)
+        for btn, state in zip(self.difficulty_buttons, difficulty_states):
+            btn.render_rect(state)
+
+        for btn, selected in zip(self.difficulty_buttons, choices):
             if selected:
-                x, y, w, h = button_rects[i]
-                pygame.draw.rect(overlay, pygame.Color('green'), (x, y, w, h), 6, border_radius=6)
-
-        self.screen.blit(overlay, (0, 0))
-        return resume_clicked, self.choices, quit_clicked
-
-    def main_loop(self):
-        """The main game loop."""
+                pygame.draw.rect(overlay, pygame.Color('green'), btn.rect_rect(), 6, border_radius=6)
+
+    def handle_event(self, event):
+        """Handles the profiler hotkeys, everything else goes to the game rules."""
+        if event.type == pygame.KEYDOWN and event.key == PROFILER_HUD_KEY:
+            self.profiler_hud.toggle()
+        elif event.type == pygame.KEYDOWN and event.key == PROFILER_EXPORT_KEY:
+            self.export_profile()
+        elif event.type == pygame.KEYDOWN and event.key == LANGUAGE_KEY:
+            self.cycle_language()
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN:
+            self.latency.submitting(*self.queue_window)
+            super().handle_event(event)
+            self.latency.submitted()
+        else:
+            super().handle_event(event)
+
+    def answered(self, word):
+        """Times the answer."""
+        self.latency.answered(word)
+
+    def launch_projectile(self, word_to_hit):
+        """Sends the sound wave and times it."""
+        super().launch_projectile(word_to_hit)
+        self.latency.launched(word_to_hit)
+
+    def cycle_language(self):
+        """Switches to the next WIKA language that has words."""
+        start = WIKA.index(self.language)
+        for step in range(1, len(WIKA)):
+            index = (start + step) % len(WIKA)
+            if LEXICONS[WIKA[index]].available():
+                self.apply_action('language', index)
+                return
+        print("No other language has a word list")
+
+    def set_language(self, language):
+        """Switches the language and rebuilds the background layer, which shows its name."""
+        super().set_language(language)
+        self.renderer.background = self.build_background_layer()
+        self.renderer.invalidate()
+
+    def export_profile(self):
+        """Saves the profiler samples of the last frames next to the assets."""
+        if not self.timer.frames:
+            print("Profiler: nothing recorded yet, show the HUD first")
+            return
+        path = get_asset_path(PROFILE_EXPORT_PATH.format(time.strftime('%Y%m%d-%H%M%S')))
+        try:
+            self.timer.export(path, extra={
+                'level': self.level,
+                'words': len(self.word_objects),
+                'projectiles': len(self.projectiles),
+                'pools': pool_stats(),
+                'sprite_cache': SPRITE_CACHE.stats(),
+                'text_cache': TEXT_CACHE.stats(),
+                'latency_ms': self.latency.summarize(),
+            })
+            print(f"Profiler: wrote {path}")
+        except OSError as e:
+            print(f"Warning: Could not write profile to {path}: {e}")
+
+    def draw_entities(self):
+        """Draws the falling words and the projectiles."""
+        with self.timer.scope('draw_words'):
+            for word in self.word_objects:
+                self.renderer.mark(word.draw(self.screen))
+        with self.timer.scope('draw_projectiles'):
+            for proj in self.projectiles:
+                self.renderer.mark(proj.draw(self.screen))
+
+    @property
+    def render_scale(self):
+        """The current internal render scale."""
+        return self.screen.factor if isinstance(self.screen, ScaledScreen) else 1.0
+
+    def set_render_scale(self, factor):
+        """Switches the internal render scale (only with a ScaledScreen) and redraws the next frame in full."""
+        self.screen.set_factor(factor)
+        self.renderer.invalidate()
+
+    def adjust_render_scale(self, frame_seconds):
+        """
+        Auto render scale: steps down to the next AUTO_SCALE_STEPS entry while the mean frame is over budget.
+        If a step made frames no faster, it goes back up and stays there.
+        """
+        self.render_frame_times.append(frame_seconds)
+        if len(self.render_frame_times) < AUTO_SCALE_FRAMES:
+            return
+        mean_ms = sum(self.render_frame_times) * 1000.0 / len(self.render_frame_times)
+        self.render_frame_times = []
+        self.render_scale_means[self.render_scale] = mean_ms
+        higher = [factor for factor in AUTO_SCALE_STEPS if factor > self.render_scale]
+        if higher and mean_ms >= self.render_scale_means.get(higher[-1], math.inf):
+            print(f"Render scale: {self.render_scale} is no faster ({mean_ms:.1f} ms) than {higher[-1]} "
+                  f"({self.render_scale_means[higher[-1]]:.1f} ms), going back to {higher[-1]}")
+            self.render_scale_floor = higher[-1]
+            self.set_render_scale(higher[-1])
+            return
+        lower = [factor for factor in AUTO_SCALE_STEPS if self.render_scale_floor <= factor < self.render_scale]
+        if mean_ms > AUTO_SCALE_BUDGET_MS and lower:
+            print(f"Render scale: frames take {mean_ms:.1f} ms (budget {AUTO_SCALE_BUDGET_MS:.1f} ms), lowering to {lower[0]}")
+            self.set_render_scale(lower[0])
+
+    def run_frame(self, delta_time, events, mouse_pos):
+        """Handles one frame: input events, fixed simulation steps, drawing and presenting."""
+        frame_start = time.perf_counter()
+        # Events handed in without get_events() (benchmarks) count as arriving at the frame start
+        self.queue_window = self.queued_since or (frame_start, frame_start)
+        self.queued_since = None
         mouse_clicked_this_frame = False
-        while True:
-            delta_time = self.clock.tick(FPS) / 1000.0
-            mouse_pos = pygame.mouse.get_pos()
-            mouse_clicked_this_frame = False
-
-            for event in pygame.event.get():
+        with self.timer.scope('events'):
+            for event in events:
                 if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
+                    self.quit()
+                elif self.player is not None and not (event.type == pygame.KEYDOWN and
+                                                      event.key in (PROFILER_HUD_KEY, PROFILER_EXPORT_KEY)):
+                    continue # Only the profiler keys work while a replay plays
                 elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                     mouse_clicked_this_frame = True
-                
-                # --- INPUT HANDLING BLOCK ---
-                # These events should only be processed if the game is NOT paused and NOT game over
-                if not self.paused and not self.game_over:
-                    if event.type == pygame.TEXTINPUT:
-                        self.active_string += event.text
-                    elif event.type == pygame.KEYDOWN:
-                        if event.key == pygame.K_BACKSPACE:
-                            self.active_string = self.active_string[:-1]
-                        elif event.key == pygame.K_RETURN:
-                            self.submit = self.active_string.lower()
-                            self.active_string = ''
-                            self.check_answer() # Call check_answer immediately on RETURN
-                
-                # Handle ESCAPE key for pause/unpause, always allowed
-                if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-                    if self.paused:
-                        self.paused = False
-                        # Reset level if difficulty changed during pause
-                        if self.choices != self.last_choices_before_pause:
-                            self.level = 1
-                            self.new_level = True
-                            self.score = 0
-                            self.lives = LIVES_START
-                            self.word_objects = []
-                            self.words_generated_this_level = 0
-                            self.words_typed_this_level = 0
-                            self.words_missed_this_level = 0
-                        self.last_choices_before_pause = copy.deepcopy(self.choices)
-                    else:
-                        self.paused = True
-                        self.last_choices_before_pause = copy.deepcopy(self.choices)
-
-            # --- DRAWING AND GAME LOGIC ---
-            # Draw the screen and get if the pause button was clicked
+                self.handle_event(event)
+
+        # --- GAME LOGIC ---
+        if self.player is not None:
+            self.player.advance(delta_time, self.replay_speed)
+        else:
+            # Run as many fixed steps as the real time elapsed, so speeds do not depend on the frame rate
+            self.time_accumulator = min(self.time_accumulator + delta_time, FIXED_DT * MAX_STEPS_PER_FRAME)
+            while self.time_accumulator >= FIXED_DT:
+                self.step(FIXED_DT)
+                self.time_accumulator -= FIXED_DT
+        self.latency.poll_hits()
+
+        # --- DRAWING ---
+        # Draw the screen and get if the pause button was clicked
+        with self.timer.scope('draw_screen'):
             pause_button_clicked = self.draw_screen(mouse_pos, mouse_clicked_this_frame)
 
-            # Check if the pause button was clicked and the game is not already paused or over
-            if pause_button_clicked and not self.paused and not self.game_over:
-                self.paused = True
-                self.last_choices_before_pause = copy.deepcopy(self.choices)
+        # Check if the pause button was clicked and the game is not already paused or over
+        if pause_button_clicked and not self.paused and not self.game_over:
+            self.apply_action('pause')
 
-            if self.paused:
+        if self.paused:
+            with self.timer.scope('overlays'):
                 resume_clicked, _, quit_clicked = self.draw_pause(mouse_pos, mouse_clicked_this_frame)
-                if resume_clicked:
-                    self.paused = False
-                    if self.choices != self.last_choices_before_pause:
-                        self.level = 1
-                        self.new_level = True
-                        self.score = 0
-                        self.lives = LIVES_START
-                        self.word_objects = []
-                        self.words_generated_this_level = 0
-                        self.words_typed_this_level = 0
-                        self.words_missed_this_level = 0
-                    self.last_choices_before_pause = copy.deepcopy(self.choices)
-                if quit_clicked:
-                    pygame.quit()
-                    sys.exit()
-            elif self.game_over:
+            if resume_clicked:
+                self.apply_action('resume')
+            if quit_clicked:
+                self.quit()
+        elif self.game_over:
+            with self.timer.scope('overlays'):
                 continue_clicked, exit_clicked = self.draw_game_over(mouse_pos, mouse_clicked_this_frame)
-                if continue_clicked:
-                    self.game_over = False
-                    self.paused = True # Go to pause screen to select difficulty
-                    self.lives = LIVES_START
-                    self.score = 0
-                    self.word_objects = []
-                    self.level = 1
-                    self.new_level = True
-                    self.active_string = ''
-                    self.submit = ''
-                    self.words_generated_this_level = 0
-                    self.words_typed_this_level = 0
-                    self.words_missed_this_level = 0
-                    self.last_choices_before_pause = copy.deepcopy(self.choices)
-                if exit_clicked:
-                    pygame.quit()
-                    sys.exit()
-            else: # Game is running
-                if self.new_level:
-                    self.word_objects = self.generate_level()
-                    self.new_level = False
-
-                # Update actor animation
-                if self.actor_is_animating:
-                    self.actor_animation_timer += self.actor_animation_speed * delta_time
-                    
-                    # Check if animation is completing this frame
-                    if self.actor_animation_timer >= self.actor_animation_duration_frames:
-                        # Play gong sound effect here
-                        if self.gong_sfx:
-                            self.gong_sfx.play()
-
-                        self.actor_is_animating = False
-                        self.actor_current_frame = 0
-                        self.actor_animation_timer = 0.0
-                        self.current_actor_image = self.actor_idle_image
-
-                        # Launch projectile ONLY when animation is done and there's a pending target
-                        if self.projectile_pending_target:
-                            word_to_hit = self.projectile_pending_target
-                            projectile_start_x = self.actor_pos_x + self.current_actor_image.get_width() // 2 + 30
-                            projectile_start_y = self.actor_pos_y + self.current_actor_image.get_height() // 2 - 20
-                            
-                            projectile_target_x = word_to_hit.bulalakaw.rect.centerx
-                            projectile_target_y = word_to_hit.bulalakaw.rect.centery
-                            
-                            new_projectile = SoundWaveProjectile(
-                                projectile_start_x, 
-                                projectile_start_y, 
-                                projectile_target_x, 
-                                projectile_target_y,
-                                speed=1200, 
-                                base_radius=20, 
-                                thickness=4, 
-                                color=(49, 149, 149) # You can change this color here
-                            ) 
-                            self.projectiles.append(new_projectile)
-                            self.projectile_pending_target = None 
-                    else:
-                        self.actor_current_frame = int(self.actor_animation_timer)
-                        self.actor_current_frame = min(self.actor_current_frame, self.actor_animation_duration_frames - 1)
-                        self.current_actor_image = self.abatang_frames[self.actor_current_frame]
-
-                # Update and draw words
-                words_to_remove = []
-                for word in self.word_objects:
-                    word.draw(self.screen, self.active_string)
-                    if word.update(delta_time): 
-                        if not word.hit_by_projectile and word.get_bottom() > HEIGHT: 
-                            self.lives -= 1
-                            self.words_missed_this_level += 1
-                        words_to_remove.append(word)
-
-                for word in words_to_remove:
-                    self.word_objects.remove(word)
-                
-                # Check for projectile-word collisions and update projectiles
-                projectiles_to_remove = []
-                for proj in self.projectiles:
-                    proj.update(delta_time)
-                    proj.draw(self.screen) 
-                    
-                    if proj.done: 
-                        projectiles_to_remove.append(proj)
-                        continue 
-
-                    # Collision logic for SoundWaveProjectile:
-                    # Check if the word's bulalakaw rect is *colliding* with the projectile's rect
-                    # AND if the word is typed and not yet hit.
-                    for word in self.word_objects:
-                        if word.typed and not word.hit_by_projectile and proj.rect.colliderect(word.bulalakaw.rect):
-                            word.trigger_boom_from_hit()
-                            proj.done = True 
-                            break 
-
-                for proj in projectiles_to_remove:
-                    if proj in self.projectiles:
-                        self.projectiles.remove(proj)
-
-                # Level completion logic
-                if self.words_typed_this_level + self.words_missed_this_level >= self.words_generated_this_level and self.words_generated_this_level > 0:
-                    if len(self.word_objects) == 0 and len(self.projectiles) == 0:
-                        self.level += 1
-                        self.new_level = True
-
-                # Game over condition
-                if self.lives <= 0:
-                    self.game_over = True
-                    self.lives = 0 
+            if continue_clicked:
+                self.apply_action('restart')
+            if exit_clicked:
+                self.quit()
+        else: # Game is running
+            self.draw_entities()
+
+        self.renderer.mark(self.profiler_hud.draw(self.screen, self))
+
+        if self.paused or self.game_over:
+            # Full-screen overlays cover everything, so the next frame starts from a clean full redraw
+            self.renderer.invalidate()
+        with self.timer.scope('flip'):
+            self.renderer.present()
+        self.latency.presented()
+        self.timer.end_frame()
+        if self.auto_render_scale and not self.is_idle():
+            self.adjust_render_scale(time.perf_counter() - frame_start)
+        if ASSET_PROFILE.first_frame_shown():
+            print(ASSET_PROFILE.report())
+            # Warm the mixer and the rest of the gong animation now that the game is up,
+            # so the first answer waits for neither the sound file nor the frames
+            if self.gong_sfx:
+                self.gong_sfx.get()
+            for frame in self.abatang_frames:
+                frame.get()
+
+    def quit(self):
+        """Saves the session's replay and exits."""
+        self.save_replay()
+        pygame.quit()
+        sys.exit()
+
+    def save_replay(self):
+        """Writes the recorded replay, if anything was played."""
+        if self.replay is None or not self.replay.events:
+            return
+        self.replay.finish(self)
+        path = get_asset_path(REPLAY_PATH.format(time.strftime('%Y%m%d-%H%M%S')))
+        try:
+            self.replay.save(path)
+        except OSError as e:
+            print(f"Warning: Could not save replay to {path}: {e}")
+
+    def play_replay(self, replay, speed=1.0):
+        """Shows a recorded session at speed times real time. The game's own input is ignored meanwhile."""
+        self.player = ReplayPlayer(replay, self)
+        self.replay_speed = speed
+        while not self.player.finished:
+            delta_time = self.clock.tick(FPS) / 1000.0
+            # No mouse: menu buttons are pressed by the replay's actions
+            self.run_frame(delta_time, self.get_events(), (-1, -1))
+        self.player = None
+        return (self.level, self.score, self.lives)
+
+    def is_idle(self):
+        """True while nothing on screen moves by itself: the pause and game over menus (unless a replay plays)."""
+        return (self.paused or self.game_over) and self.player is None
+
+    def get_events(self):
+        """Empties SDL's event queue, noting when, so the latency telemetry can bound how long the events waited there."""
+        now = time.perf_counter()
+        self.queued_since = (self.last_queue_read, now)
+        self.last_queue_read = now
+        return pygame.event.get()
+
+    def wait_events(self):
+        """Blocks until an event arrives or a 1 / IDLE_FPS timeout passes. Returns the events (maybe none)."""
+        event = pygame.event.wait(int(1000 / IDLE_FPS))
+        self.last_queue_read = time.perf_counter() # The wait ends as soon as an event is queued
+        events = [] if event.type == pygame.NOEVENT else [event]
+        events.extend(self.get_events())
+        return events
 
-            pygame.display.flip()
+    def main_loop(self):
+        """The main game loop. In the menus it sleeps until there is input instead of redrawing at full rate."""
+        was_idle = False
+        while True:
+            if self.is_idle():
+                events = self.wait_events()
+                if was_idle and not events:
+                    continue # Nothing happened, the menu on screen is still up to date
+                if was_idle and all(event.type == pygame.MOUSEMOTION for event in events):
+                    # Only the hover changed: these redraws are capped at IDLE_FPS so a stream of mouse motion
+                    # can't run the menu at full rate. Input that arrives meanwhile is read right after the sleep.
+                    self.clock.tick(IDLE_FPS)
+                    events.extend(self.get_events())
+                else:
+                    self.clock.tick() # Clicks and keys are handled at once
+                # Nothing steps in the menu, so the time only counts if this frame's input leaves it:
+                # then the game carries on from one step instead of catching up on the time spent there
+                delta_time = FIXED_DT
+                was_idle = True
+            else:
+                # Sleep first, so the events are as fresh as possible when the frame handles them
+                delta_time = self.clock.tick(FPS) / 1000.0
+                events = self.get_events()
+                if was_idle:
+                    # The menu frame may be long ago: carry on from one step instead of catching up
+                    delta_time = min(delta_time, FIXED_DT)
+                was_idle = False
+            self.run_frame(delta_time, events, pygame.mouse.get_pos())
 
 if __name__ == '__main__':
-    game = Game(madali_words, katamtaman_words, mahirap_words)
+    game = Game()
     game.main_loop()
\ No newline at end of file